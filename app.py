@@ -2,24 +2,45 @@ import math
 import re
 import io
 import csv
+import hashlib
 import json
 import html
 import logging
 import os
 import sys
 import secrets
-from collections import deque
-from datetime import datetime, date, time, timedelta
-from functools import wraps
-from typing import Any, Tuple
-from urllib.parse import urljoin, urldefrag, urlparse, quote_plus, urlencode
+import socket
+import sqlite3
+import threading
+import multiprocessing
+import atexit
+import codecs
+import zlib
+import heapq
+from collections import Counter, defaultdict, deque
+from concurrent.futures import FIRST_EXCEPTION, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import contextmanager
+from datetime import datetime, date, time, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, wraps
+from queue import Empty, Queue
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, Iterable, Tuple
+from urllib.parse import urljoin, urldefrag, urlparse, urlsplit, urlunsplit, quote_plus, unquote_plus, urlencode
+from urllib.robotparser import RobotFileParser
+from xml.etree.ElementTree import ParseError, XMLPullParser
 from dotenv import load_dotenv
 
 _APP_DOTENV_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), ".env")
 load_dotenv(dotenv_path=_APP_DOTENV_PATH, override=False)
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import CData, NavigableString, Tag
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
 from flask import (
   Flask,
   request,
@@ -30,6 +51,7 @@ from flask import (
   url_for,
   session,
   flash,
+  Response,
 )
 from werkzeug.security import generate_password_hash, check_password_hash
 from werkzeug.utils import secure_filename
@@ -4287,9 +4309,25 @@ HTML_TEMPLATE = """
                   <input type="url" class="form-control form-control-sm" id="start_url" name="start_url" placeholder="https://example.com" required>
                   <div class="invalid-feedback">Please enter a valid URL to start crawling.</div>
                 </div>
+                <details id="batch-options" class="mb-3">
+                  <summary class="small-note text-uppercase">Batch: several websites</summary>
+                  <div class="mt-2">
+                    <label for="seeds" class="form-label small-note text-uppercase">Websites (one per line)</label>
+                    <textarea id="seeds" class="form-control form-control-sm" name="seeds" rows="4" placeholder="example.com&#10;https://another-example.at"></textarea>
+                  </div>
+                  <div class="mt-2">
+                    <label for="seeds_file" class="form-label small-note text-uppercase">Or upload a CSV</label>
+                    <input type="file" class="form-control form-control-sm" id="seeds_file" name="seeds_file" accept=".csv,.txt,text/csv,text/plain">
+                  </div>
+                  <div class="mt-2">
+                    <label for="page_budget" class="form-label small-note text-uppercase">Total pages for the batch</label>
+                    <input type="number" class="form-control form-control-sm" id="page_budget" name="page_budget" min="1" max="{{ batch_max_pages }}" placeholder="Max pages × websites">
+                  </div>
+                </details>
                 <div class="mb-3">
-                  <label for="max_pages" class="form-label small-note text-uppercase">Max pages</label>
-                  <input type="number" class="form-control form-control-sm" id="max_pages" name="max_pages" min="1" max="200" value="100" required>
+                  <label for="max_pages" class="form-label small-note text-uppercase">Max pages (per website)</label>
+                  <input type="number" class="form-control form-control-sm" id="max_pages" name="max_pages" min="1" max="{{ max_pages_limit }}" value="100" required>
+                  <span class="small-note">From {{ large_crawl_pages }} pages on, the result is a CSV instead of a PDF.</span>
                 </div>
                 <div class="d-flex align-items-center gap-2 flex-wrap">
                   <button id="submit-btn" type="submit" class="btn btn-sm btn-primary">
@@ -4299,8 +4337,24 @@ HTML_TEMPLATE = """
                   <button id="reset-btn" type="button" class="btn btn-sm btn-outline-secondary" onclick="document.getElementById('crawl-form').reset()">
                     Reset
                   </button>
+                  <button id="cancel-btn" type="button" class="btn btn-sm btn-outline-secondary d-none">
+                    Stop crawl
+                  </button>
+                  <button id="resume-btn" type="button" class="btn btn-sm btn-outline-primary d-none">
+                    Resume crawl
+                  </button>
+                  <a id="download-link" class="btn btn-sm btn-link text-decoration-none d-none" href="#">Download PDF</a>
                   <div id="status" class="ms-1 small-note" aria-live="polite"></div>
                 </div>
+                <div id="crawl-live" class="mt-3 d-none">
+                  <div class="d-flex align-items-center gap-2 flex-wrap mb-1">
+                    <span class="divider-label">Contacts so far</span>
+                    <a id="csv-link" class="small-note" href="#">CSV</a>
+                    <a id="jsonl-link" class="small-note" href="#">JSONL</a>
+                  </div>
+                  <div id="last-page" class="small-note text-truncate"></div>
+                  <ul id="live-contacts" class="list-unstyled small-note mb-0"></ul>
+                </div>
               </form>
             </div>
           </div>
@@ -4374,20 +4428,176 @@ HTML_TEMPLATE = """
     })();
     (function () {
       'use strict'
+      const JOB_KEY = 'pm-crawl-job';
+      const POLL_MS = 2000;
+      const EVENTS_MS = 1000;
       const form = document.getElementById('crawl-form');
+      const btn = document.getElementById('submit-btn');
+      const spinner = document.getElementById('btn-spinner');
+      const status = document.getElementById('status');
+      const cancelBtn = document.getElementById('cancel-btn');
+      const resumeBtn = document.getElementById('resume-btn');
+      const startUrl = document.getElementById('start_url');
+      const seedsInput = document.getElementById('seeds');
+      const seedsFile = document.getElementById('seeds_file');
+      const downloadLink = document.getElementById('download-link');
+      const live = document.getElementById('crawl-live');
+      const lastPage = document.getElementById('last-page');
+      const liveContacts = document.getElementById('live-contacts');
+      const LIVE_CONTACT_LIMIT = 8;
+      const STOP_LABELS = { deadline: 'time limit', no_new_contacts: 'no new contacts', byte_budget: 'download limit' };
+      let pollTimer = null;
+      let followGeneration = 0;
+      let stopping = false;
+
+      const rememberJob = (job) => {
+        try { localStorage.setItem(JOB_KEY, JSON.stringify({ id: job.id, downloaded: false })); } catch (e) {}
+      };
+      const storedJob = () => {
+        try { return JSON.parse(localStorage.getItem(JOB_KEY) || 'null'); } catch (e) { return null; }
+      };
+      const markDownloaded = (jobId) => {
+        try { localStorage.setItem(JOB_KEY, JSON.stringify({ id: jobId, downloaded: true })); } catch (e) {}
+      };
+      const setBusy = (busy) => {
+        btn.disabled = busy;
+        spinner.classList.toggle('d-none', !busy);
+        cancelBtn.classList.toggle('d-none', !busy);
+      };
+      const syncBatch = () => {
+        // A batch needs no start URL; the websites list or CSV replaces it.
+        startUrl.required = !(seedsInput.value.trim() || seedsFile.files.length);
+      };
+      const describe = (job) => {
+        const sites = job.seed_count > 1 ? ' across ' + job.seed_count + ' sites' : '';
+        const counts = job.pages_fetched + ' pages, ' + job.contacts_found + ' contacts' + sites;
+        if (job.status === 'queued') return 'Queued…';
+        if (job.status === 'running') {
+          const stopping = job.cancel_requested ? 'Stopping… ' : 'Crawling… ';
+          return stopping + counts + ', ' + job.queue_size + ' queued';
+        }
+        if (job.status === 'finished') {
+          const early = (job.stop_reason || '').split(', ').map((reason) => STOP_LABELS[reason]).filter(Boolean);
+          const done = early.length ? 'Stopped early (' + early.join(', ') + '): ' : 'Done: ';
+          return done + counts + ', ' + (job.row_count || 0) + ' rows';
+        }
+        if (job.status === 'cancelled') return 'Stopped: ' + counts + ', ' + (job.row_count || 0) + ' rows';
+        return 'Error: ' + (job.error || 'Crawl failed');
+      };
+      const download = (job) => {
+        const a = document.createElement('a');
+        a.href = job.download_url;
+        document.body.appendChild(a);
+        a.click();
+        a.remove();
+      };
+      const showLive = (job) => {
+        document.getElementById('csv-link').href = job.csv_url;
+        document.getElementById('jsonl-link').href = job.jsonl_url;
+        live.classList.remove('d-none');
+      };
+      const addContact = (contact) => {
+        const li = document.createElement('li');
+        li.className = 'text-truncate';
+        li.textContent = [contact.business_name, contact.email, contact.phone].filter(Boolean).join(' · ');
+        liveContacts.prepend(li);
+        while (liveContacts.children.length > LIVE_CONTACT_LIMIT) liveContacts.lastChild.remove();
+      };
+      const showJob = (job, autoDownload) => {
+        status.textContent = describe(job);
+        const active = job.status === 'queued' || job.status === 'running';
+        stopping = !!job.cancel_requested && active;
+        setBusy(active);
+        showLive(job);
+        cancelBtn.disabled = !!job.cancel_requested;
+        resumeBtn.classList.toggle('d-none', !job.resume_url);
+        resumeBtn.disabled = false;
+        if (job.download_url) {
+          downloadLink.href = job.download_url;
+          downloadLink.classList.remove('d-none');
+          if (autoDownload) {
+            markDownloaded(job.id);
+            download(job);
+          }
+        } else {
+          downloadLink.classList.add('d-none');
+        }
+        return active;
+      };
+      const shouldAutoDownload = (job) => {
+        const stored = storedJob();
+        return !!(stored && stored.id === job.id && !stored.downloaded);
+      };
+      const follow = async (job, generation, cursor) => {
+        if (generation !== followGeneration) return;
+        try {
+          const resp = await fetch(job.events_url + '?after=' + cursor, { cache: 'no-store' });
+          if (!resp.ok) throw new Error('Server returned ' + resp.status);
+          const data = await resp.json();
+          if (generation !== followGeneration) return;
+          let page = null;
+          data.events.forEach((event) => {
+            if (event.type === 'page') page = event;
+            else if (event.type === 'contact') addContact(event);
+          });
+          if (!showJob(data.job, shouldAutoDownload(data.job))) {
+            lastPage.textContent = '';
+            return;
+          }
+          if (page) {
+            status.textContent = (stopping ? 'Stopping… ' : 'Crawling… ') + page.pages_fetched + ' pages, '
+              + page.contacts_found + ' contacts, ' + page.queue_size + ' queued';
+            lastPage.textContent = page.status + ' ' + page.url;
+          }
+          pollTimer = setTimeout(() => follow(data.job, generation, data.next), data.more ? 0 : EVENTS_MS);
+        } catch (err) {
+          console.error(err);
+          status.textContent = 'Connection problem, retrying…';
+          pollTimer = setTimeout(() => follow(job, generation, cursor), POLL_MS * 2);
+        }
+      };
+      const poll = async (jobId) => {
+        clearTimeout(pollTimer);
+        try {
+          const resp = await fetch('/crawler/jobs/' + encodeURIComponent(jobId), { cache: 'no-store' });
+          if (resp.status === 404) {
+            try { localStorage.removeItem(JOB_KEY); } catch (e) {}
+            setBusy(false);
+            status.textContent = '';
+            return;
+          }
+          if (!resp.ok) throw new Error('Server returned ' + resp.status);
+          const job = await resp.json();
+          if (showJob(job, shouldAutoDownload(job))) {
+            // Replay the job's events from the start, then follow new ones.
+            followGeneration += 1;
+            liveContacts.innerHTML = '';
+            follow(job, followGeneration, 0);
+          }
+        } catch (err) {
+          console.error(err);
+          status.textContent = 'Connection problem, retrying…';
+          pollTimer = setTimeout(() => poll(jobId), POLL_MS * 2);
+        }
+      };
+
+      seedsInput.addEventListener('input', syncBatch);
+      seedsFile.addEventListener('change', syncBatch);
+      form.addEventListener('reset', () => setTimeout(syncBatch));
+
       form.addEventListener('submit', async function (event) {
         event.preventDefault();
         event.stopPropagation();
+        syncBatch();
         if (!form.checkValidity()) {
           form.classList.add('was-validated');
           return;
         }
-        const btn = document.getElementById('submit-btn');
-        const spinner = document.getElementById('btn-spinner');
-        const status = document.getElementById('status');
-        btn.disabled = true;
-        spinner.classList.remove('d-none');
-        status.textContent = 'Crawling… this may take a while';
+        setBusy(true);
+        downloadLink.classList.add('d-none');
+        live.classList.add('d-none');
+        liveContacts.innerHTML = '';
+        status.textContent = 'Starting crawl…';
         try {
           const formData = new FormData(form);
           const resp = await fetch('/crawler', { method: 'POST', body: formData });
@@ -4395,31 +4605,46 @@ HTML_TEMPLATE = """
             const errText = await resp.text();
             throw new Error('Server returned ' + resp.status + (errText ? ' – ' + errText : ''));
           }
-          const blob = await resp.blob();
-          let filename = 'contacts.pdf';
-          const cd = resp.headers.get('content-disposition');
-          if (cd) {
-            const m = cd.match(/filename\\*=UTF-8''([^;]+)|filename="?([^";]+)"?/);
-            if (m) filename = decodeURIComponent((m[1] || m[2]).replace(/["']/g, ''));
-          }
-          const url = URL.createObjectURL(blob);
-          const a = document.createElement('a');
-          a.href = url;
-          a.download = filename;
-          document.body.appendChild(a);
-          a.click();
-          a.remove();
-          URL.revokeObjectURL(url);
-          status.textContent = 'Download started';
+          const job = await resp.json();
+          rememberJob(job);
+          poll(job.id);
         } catch (err) {
           console.error(err);
+          setBusy(false);
           status.textContent = 'Error: ' + (err.message || 'Unexpected error');
-        } finally {
-          btn.disabled = false;
-          spinner.classList.add('d-none');
-          setTimeout(() => { status.textContent = ''; }, 6000);
         }
       }, false);
+
+      cancelBtn.addEventListener('click', async function () {
+        const stored = storedJob();
+        if (!stored) return;
+        cancelBtn.disabled = true;
+        try {
+          const resp = await fetch('/crawler/jobs/' + encodeURIComponent(stored.id) + '/cancel', { method: 'POST' });
+          if (resp.ok) showJob(await resp.json(), false);
+        } catch (err) {
+          console.error(err);
+        }
+      });
+
+      resumeBtn.addEventListener('click', async function () {
+        const stored = storedJob();
+        if (!stored) return;
+        resumeBtn.disabled = true;
+        try {
+          const resp = await fetch('/crawler/jobs/' + encodeURIComponent(stored.id) + '/resume', { method: 'POST' });
+          if (!resp.ok) throw new Error('Server returned ' + resp.status);
+          const job = await resp.json();
+          rememberJob(job);
+          poll(job.id);
+        } catch (err) {
+          console.error(err);
+          resumeBtn.disabled = false;
+        }
+      });
+
+      const resumed = storedJob();
+      if (resumed && resumed.id) poll(resumed.id);
     })();
     (function () {
       'use strict';
@@ -6049,7 +6274,31 @@ else:
 
 # --- Business constants --------------------------------------------------------
 
+def _env_int(name: str, default: int, minimum: int = 0) -> int:
+  try:
+    value = int(os.getenv(name, str(default)))
+  except (TypeError, ValueError):
+    value = default
+  return max(minimum, value)
+
+
+def _env_float(name: str, default: float, minimum: float = 0.0) -> float:
+  try:
+    value = float(os.getenv(name, str(default)))
+  except (TypeError, ValueError):
+    value = default
+  return max(minimum, value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+  raw = (os.getenv(name) or "").strip().lower()
+  if not raw:
+    return default
+  return raw in {"1", "true", "yes", "on"}
+
+
 DEFAULT_PHONE_REGION = os.getenv("CRAWLER_DEFAULT_REGION", "US").upper()
+PHONE_PARSE_CACHE_SIZE = _env_int("CRAWLER_PHONE_CACHE_SIZE", 50000)
 
 EU_COUNTRY_CODES = {
   "30", "31", "32", "33", "34", "36", "39",
@@ -6160,6 +6409,35 @@ def _infer_region_from_netloc(netloc: str) -> str | None:
   return REGION_FROM_TLD.get(tld)
 
 
+@lru_cache(maxsize=PHONE_PARSE_CACHE_SIZE)
+def _parse_phone_with_phonenumbers(candidate: str, region_code: str | None) -> str | None:
+  # Footer and header numbers repeat on every page of a site, so results are memoized per (candidate, region).
+  try:
+    parsed = phonenumbers.parse(candidate, region_code)
+  except phonenumbers.NumberParseException:
+    return None
+  if phonenumbers.is_possible_number(parsed) and phonenumbers.is_valid_number(parsed):
+    return phonenumbers.format_number(parsed, PhoneNumberFormat.E164)
+  return None
+
+
+def phone_parse_cache_stats() -> dict[str, int]:
+  info = _parse_phone_with_phonenumbers.cache_info()
+  return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize or 0}
+
+
+def warm_phone_metadata(region: str | None) -> None:
+  """Load libphonenumber metadata for ``region`` up front instead of on the first candidate."""
+  if not PHONENUMBERS_AVAILABLE or not region:
+    return
+  try:
+    example = phonenumbers.example_number(region)
+    if example is not None:
+      phonenumbers.is_valid_number(example)
+  except Exception:
+    app.logger.debug("Could not warm phone metadata for %s", region, exc_info=True)
+
+
 def _parse_phone_candidate(raw: str | None, region: str | None = None) -> str | None:
   if not raw:
     return None
@@ -6168,13 +6446,7 @@ def _parse_phone_candidate(raw: str | None, region: str | None = None) -> str |
     return None
   if PHONENUMBERS_AVAILABLE:
     region_code = None if candidate.startswith("+") else (region or DEFAULT_PHONE_REGION)
-    try:
-      parsed = phonenumbers.parse(candidate, region_code)
-    except phonenumbers.NumberParseException:
-      return None
-    if phonenumbers.is_possible_number(parsed) and phonenumbers.is_valid_number(parsed):
-      return phonenumbers.format_number(parsed, PhoneNumberFormat.E164)
-    return None
+    return _parse_phone_with_phonenumbers(candidate, region_code)
 
   digits = re.sub(r"\D", "", candidate)
   if not digits or len(digits) < 7 or len(digits) > 15:
@@ -6203,22 +6475,141 @@ def is_valid_phone(number: str | None, region: str | None = None) -> bool:
   return bool(_parse_phone_candidate(number, region=region))
 
 
-def find_labelled_phones(text: str | None, region: str | None = None) -> list[str]:
+_NON_DIGIT_REGEX = re.compile(r"\D")
+_WHITESPACE_REGEX = re.compile(r"\s+")
+# Real numbers are at least half digits once spaces are removed, even "(0) 1 / 23 / 45 / 67".
+PHONE_PREFILTER_MIN_DIGIT_DENSITY = 0.5
+
+_phone_candidate_stats: Counter = Counter()
+_phone_candidate_stats_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _country_digit_bounds(country_code: int) -> tuple[int, int] | None:
+  """
+  Fewest and most digits a number of ``country_code`` can carry after the
+  international prefix: the country code, an optional literal trunk prefix
+  ("+43 (0)1 ...") and the national number lengths from libphonenumber. None
+  when a region of the code strips prefixes by pattern (carrier codes, local
+  dialling), where no tight bound exists.
+  """
+  regions = phonenumbers.region_codes_for_country_code(country_code)
+  metadata = [phonenumbers.PhoneMetadata.metadata_for_region(region) for region in regions if region != "001"]
+  if "001" in regions:
+    metadata.append(phonenumbers.PhoneMetadata.metadata_for_nongeo_region(country_code))
+  metadata = [entry for entry in metadata if entry is not None]
+  if not metadata:
+    return None
+  prefix_digits = 0
+  for entry in metadata:
+    prefix = entry.national_prefix_for_parsing or entry.national_prefix or ""
+    if prefix and not prefix.isdigit():
+      return None
+    prefix_digits = max(prefix_digits, len(prefix))
+  lengths = [n for entry in metadata for n in entry.general_desc.possible_length]
+  code_digits = len(str(country_code))
+  return code_digits + min(lengths), code_digits + prefix_digits + max(lengths)
+
+
+@lru_cache(maxsize=None)
+def _international_prefix_regex(region_code: str) -> re.Pattern | None:
+  metadata = phonenumbers.PhoneMetadata.metadata_for_region(region_code)
+  if metadata is None or not metadata.international_prefix:
+    return None
+  return re.compile(metadata.international_prefix)
+
+
+def _international_digits_possible(digits: str) -> bool:
+  # libphonenumber takes the first 1-3 digit prefix that is an assigned country code.
+  for size in range(1, 4):
+    code = int(digits[:size] or 0)
+    if code in phonenumbers.COUNTRY_CODE_TO_REGION_CODE:
+      bounds = _country_digit_bounds(code)
+      return bounds is None or bounds[0] <= len(digits) <= bounds[1]
+  return False
+
+
+def _phone_length_possible(digits: str, region_code: str | None) -> bool:
+  """
+  Whether ``digits`` has a length some number could have when parsed for
+  ``region_code`` (None for +-prefixed candidates): national lengths of the
+  region's country code, or, behind "+" or the region's international prefix,
+  of the dialled country code.
+  """
+  if not PHONENUMBERS_AVAILABLE:
+    # Mirrors the length rule of the regex-only fallback in _parse_phone_candidate.
+    return 7 <= len(digits) <= 15
+  if region_code is None:
+    return _international_digits_possible(digits)
+  metadata = phonenumbers.PhoneMetadata.metadata_for_region(region_code)
+  if metadata is None:
+    return False
+  bounds = _country_digit_bounds(metadata.country_code)
+  if bounds is None:
+    return True
+  # A national number may be written with or without the bare country code in front.
+  fewest = bounds[0] - len(str(metadata.country_code))
+  if fewest <= len(digits) <= bounds[1]:
+    return True
+  international_prefix = _international_prefix_regex(region_code)
+  match = international_prefix.match(digits) if international_prefix else None
+  return bool(match and match.end() and _international_digits_possible(digits[match.end():]))
+
+
+def _passes_phone_prefilter(candidate: str, region: str | None) -> bool:
+  compact = _WHITESPACE_REGEX.sub("", candidate.replace("\u00a0", " "))
+  if not compact:
+    return False
+  digits = _NON_DIGIT_REGEX.sub("", compact)
+  region_code = None if compact.startswith("+") else (region or DEFAULT_PHONE_REGION)
+  if not _phone_length_possible(digits, region_code):
+    return False
+  return len(digits) >= len(compact) * PHONE_PREFILTER_MIN_DIGIT_DENSITY
+
+
+def phone_candidate_stats() -> dict[str, int]:
+  """Cumulative candidate counts per find_labelled_phones() stage."""
+  with _phone_candidate_stats_lock:
+    return dict(_phone_candidate_stats)
+
+
+def _add_phone_candidate_stats(counts: dict[str, int]) -> None:
+  with _phone_candidate_stats_lock:
+    _phone_candidate_stats.update(counts)
+
+
+def find_labelled_phones(text: str | None, region: str | None = None, stats: Counter | None = None) -> list[str]:
+  """Labelled phone numbers in ``text``; stage counts go to ``stats`` if given, else to phone_candidate_stats()."""
   if not text:
     return []
   seen: set[str] = set()
   results: list[str] = []
-  for match in PHONE_LABEL_REGEX.finditer(text):
-    normalized = normalize_phone(match.group(1), region=region)
-    if normalized and normalized not in seen:
+  counts: Counter = Counter()
+
+  def consider(candidate: str) -> None:
+    if not _passes_phone_prefilter(candidate, region):
+      counts["prefilter_rejected"] += 1
+      return
+    normalized = normalize_phone(candidate, region=region)
+    if not normalized:
+      counts["parser_rejected"] += 1
+      return
+    counts["accepted"] += 1
+    if normalized not in seen:
       seen.add(normalized)
       results.append(normalized)
+
+  for match in PHONE_LABEL_REGEX.finditer(text):
+    counts["label_candidates"] += 1
+    consider(match.group(1))
   if not results:
     for match in PHONE_TOKEN_REGEX.finditer(text):
-      normalized = normalize_phone(match.group(0), region=region)
-      if normalized and normalized not in seen:
-        seen.add(normalized)
-        results.append(normalized)
+      counts["token_candidates"] += 1
+      consider(match.group(0))
+  if stats is not None:
+    stats.update(counts)
+  elif counts:
+    _add_phone_candidate_stats(counts)
   return results
 
 
@@ -6784,6 +7175,31 @@ class Invoice(Base):
   site = relationship("Site", backref="invoices")
 
 
+class CrawlJob(Base):
+  __tablename__ = "crawl_jobs"
+
+  id = Column(String(32), primary_key=True)
+  start_url = Column(Text, nullable=False)
+  max_pages = Column(Integer, nullable=False, default=100)
+  render_js = Column(Boolean, nullable=False, default=False)
+  status = Column(String(32), nullable=False, default="queued")  # queued, running, finished, cancelled, failed
+  cancel_requested = Column(Boolean, nullable=False, default=False)
+  owner = Column(String(255))  # host:pid of the process running the job
+  pages_fetched = Column(Integer, nullable=False, default=0)
+  contacts_found = Column(Integer, nullable=False, default=0)
+  queue_size = Column(Integer, nullable=False, default=0)
+  row_count = Column(Integer)
+  result_path = Column(String(255))
+  error = Column(Text)
+  seeds = Column(Text)  # JSON list of start URLs for batch crawls; max_pages is then the per-site limit
+  page_budget = Column(Integer)  # pages shared by all sites of a batch crawl
+  stop_reason = Column(String(255))  # why each site's crawl ended, e.g. "no_new_contacts" or "max_pages, deadline"
+  created_at = Column(DateTime, default=datetime.utcnow)
+  started_at = Column(DateTime)
+  finished_at = Column(DateTime)
+  updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 Base.metadata.create_all(bind=engine)
 
 
@@ -6830,6 +7246,9 @@ _ensure_sqlite_column(engine, "sites", "hourly_rate", "FLOAT")
 _ensure_sqlite_column(engine, "sites", "contact_name", "TEXT")
 _ensure_sqlite_column(engine, "sites", "contact_email", "TEXT")
 _ensure_sqlite_column(engine, "sites", "is_active", "INTEGER NOT NULL DEFAULT 1")
+_ensure_sqlite_column(engine, "crawl_jobs", "seeds", "TEXT")
+_ensure_sqlite_column(engine, "crawl_jobs", "page_budget", "INTEGER")
+_ensure_sqlite_column(engine, "crawl_jobs", "stop_reason", "VARCHAR(255)")
 _ensure_sqlite_column(engine, "sites", "profile_company_name", "TEXT")
 _ensure_sqlite_column(engine, "sites", "profile_contact_name", "TEXT")
 _ensure_sqlite_column(engine, "sites", "profile_contact_email", "TEXT")
@@ -7026,339 +7445,2749 @@ def _normalize_netloc(netloc: str) -> str:
     return nl[4:] if nl.startswith("www.") else nl
 
 
-def fetch_with_playwright(url: str, timeout: int = 15000) -> str | None:
-    """Render page with Playwright and return HTML, or None on error."""
-    try:
-        from playwright.sync_api import sync_playwright
-    except Exception as e:
-        app.logger.debug("Playwright not available: %s", e)
-        return None
+# --- Crawler engine ------------------------------------------------------------
+
+
+CRAWLER_CONCURRENCY = _env_int("CRAWLER_CONCURRENCY", 8, minimum=1)
+CRAWLER_PER_HOST_CONCURRENCY = _env_int("CRAWLER_PER_HOST_CONCURRENCY", 4, minimum=1)
+CRAWLER_HTTP_RETRIES = _env_int("CRAWLER_HTTP_RETRIES", 2)
+CRAWLER_MAX_PAGE_KB = _env_int("CRAWLER_MAX_PAGE_KB", 5120, minimum=16)  # larger bodies are cut off here
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+FETCH_CHUNK_BYTES = 64 * 1024
+CHARSET_SNIFF_BYTES = 4096  # how far into a body to look for <meta charset>
+# 0 leaves a host unpaced until robots.txt asks for a rate or the host answers 429/503.
+CRAWLER_HOST_RATE = _env_float("CRAWLER_HOST_RATE", 0.0)
+CRAWLER_HOST_MAX_RATE = _env_float("CRAWLER_HOST_MAX_RATE", 32.0, minimum=0.2)
+CRAWLER_THROTTLE_RETRIES = _env_int("CRAWLER_THROTTLE_RETRIES", 3)
+CRAWLER_MAX_BACKOFF = _env_float("CRAWLER_MAX_BACKOFF", 120.0, minimum=1.0)
+CRAWLER_SITEMAPS = _env_bool("CRAWLER_SITEMAPS", True)
+CRAWLER_SITEMAP_MAX_FILES = _env_int("CRAWLER_SITEMAP_MAX_FILES", 20, minimum=1)
+CRAWLER_SITEMAP_MAX_SECONDS = _env_int("CRAWLER_SITEMAP_MAX_SECONDS", 60, minimum=1)  # total per crawl
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024  # sitemaps.org limit for one uncompressed file
+CRAWLER_BROWSER_POOL_SIZE = _env_int("CRAWLER_BROWSER_POOL_SIZE", 1, minimum=1)
+CRAWLER_BROWSER_MAX_PAGES = _env_int("CRAWLER_BROWSER_MAX_PAGES", 50, minimum=1)
+# "light" blocks heavy resources and trackers and waits for the DOM; "full" loads everything until network idle.
+CRAWLER_RENDER_PROFILE = (os.getenv("CRAWLER_RENDER_PROFILE") or "light").strip().lower()
+CRAWLER_RENDER_SETTLE_MS = _env_int("CRAWLER_RENDER_SETTLE_MS", 1500, minimum=0)
+RENDER_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+RENDER_BLOCKED_HOSTS = (
+    "googletagmanager.com", "google-analytics.com", "analytics.google.com", "doubleclick.net",
+    "googlesyndication.com", "googleadservices.com", "cookiebot.com", "cookielaw.org", "onetrust.com",
+    "usercentrics.eu", "consentmanager.net", "connect.facebook.net", "hotjar.com", "clarity.ms",
+    "bat.bing.com", "snap.licdn.com", "analytics.tiktok.com", "matomo.cloud", "youtube.com", "ytimg.com",
+    "vimeo.com", "maps.googleapis.com", "fonts.googleapis.com", "fonts.gstatic.com",
+)
+# Rendered contact links usually mean the page's script has filled in what the crawler looks for.
+RENDER_READY_SELECTOR = 'a[href^="mailto:"], a[href^="tel:"]'
+CRAWLER_RENDER_MEMORY = _env_bool("CRAWLER_RENDER_MEMORY", True)
+CRAWLER_RENDER_MIN_SAMPLES = _env_int("CRAWLER_RENDER_MIN_SAMPLES", 5, minimum=1)
+CRAWLER_RENDER_MEMORY_DAYS = _env_int("CRAWLER_RENDER_MEMORY_DAYS", 30, minimum=1)
+CRAWLER_CONTACT_PRIORITY = _env_bool("CRAWLER_CONTACT_PRIORITY", True)
+CRAWLER_CONTACT_MEMORY_DAYS = _env_int("CRAWLER_CONTACT_MEMORY_DAYS", 90, minimum=1)
+CRAWLER_EXTRACT_WORKERS = _env_int("CRAWLER_EXTRACT_WORKERS", 0)  # 0 parses pages in the crawl threads
+CRAWLER_EXTRACT_CHUNK_SIZE = _env_int("CRAWLER_EXTRACT_CHUNK_SIZE", 4, minimum=1)
+EXTRACT_CHUNK_WAIT = 0.005  # seconds a partial chunk waits for more pages before it is sent
+CRAWLER_USER_AGENT = "PutzelfMarketing/1.0"
+CRAWLER_HTML_PARSER = (os.getenv("CRAWLER_HTML_PARSER") or "auto").strip().lower()
+CRAWLER_STRAINED_PARSE = _env_bool("CRAWLER_STRAINED_PARSE", False)
+CRAWLER_DATA_DIR = os.path.join(APP_ROOT, os.getenv("CRAWLER_DATA_DIR") or os.path.join("instance", "crawler"))
+CRAWLER_HTTP_CACHE = _env_bool("CRAWLER_HTTP_CACHE", True)
+CRAWLER_HTTP_CACHE_MB = _env_int("CRAWLER_HTTP_CACHE_MB", 512, minimum=1)
+CRAWLER_HTTP_CACHE_TTL_DAYS = _env_int("CRAWLER_HTTP_CACHE_TTL_DAYS", 30, minimum=1)
+CRAWLER_CANONICALIZE = _env_bool("CRAWLER_CANONICALIZE", True)
+CRAWLER_SKIP_NEAR_DUPLICATES = _env_bool("CRAWLER_SKIP_NEAR_DUPLICATES", True)
+CRAWLER_NEAR_DUPLICATE_BITS = _env_int("CRAWLER_NEAR_DUPLICATE_BITS", 3)
+CRAWLER_CHECKPOINT_PAGES = _env_int("CRAWLER_CHECKPOINT_PAGES", 25, minimum=1)
+CRAWLER_MAX_PAGES = _env_int("CRAWLER_MAX_PAGES", 50000, minimum=1)  # per website, as accepted by /crawler
+# Crawls of at least this many pages keep their frontier, visited set and contacts on disk.
+CRAWLER_LARGE_CRAWL_PAGES = _env_int("CRAWLER_LARGE_CRAWL_PAGES", 1000, minimum=1)
+LARGE_CRAWL_DUPLICATE_WINDOW = 5000  # pages a large crawl remembers for near-duplicate checks
+BLOOM_FALSE_POSITIVE_RATE = 0.001
+# Early stops; 0 turns each off. The time limit is shared by all sites of a batch job.
+CRAWLER_TIME_LIMIT_MINUTES = _env_int("CRAWLER_TIME_LIMIT_MINUTES", 0)
+CRAWLER_STALL_PAGES = _env_int("CRAWLER_STALL_PAGES", 0)
+CRAWLER_MAX_CRAWL_MB = _env_int("CRAWLER_MAX_CRAWL_MB", 0)
+CRAWL_EARLY_STOP_REASONS = ("deadline", "no_new_contacts", "byte_budget")
+# Query keys canonicalize_url drops: ad-click/analytics tracking and session ids; "prefix*" matches a prefix.
+# CRAWLER_STRIP_QUERY_PARAMS replaces this list ("none" keeps every key).
+DEFAULT_STRIP_QUERY_PARAMS = (
+    "utm_*", "pk_*", "mtm_*", "hsa_*", "matomo_*",
+    "gclid", "gbraid", "wbraid", "dclid", "fbclid", "msclkid", "yclid", "twclid", "igshid",
+    "mc_cid", "mc_eid", "_ga", "_gl", "_hsenc", "_hsmi", "ref_src",
+    "phpsessid", "jsessionid", "aspsessionid", "sessionid", "session_id", "cfid", "cftoken", "zenid",
+)
+_strip_query_setting = (os.getenv("CRAWLER_STRIP_QUERY_PARAMS") or "").strip()
+CRAWLER_STRIP_QUERY_PARAMS = tuple(
+    part.strip().lower()
+    for part in (_strip_query_setting.split(",") if _strip_query_setting else DEFAULT_STRIP_QUERY_PARAMS)
+    if part.strip() and part.strip().lower() != "none"
+)
+CRAWL_EXTRACT_CACHE_VERSION = 3  # bump when page extraction changes so cached results are recomputed
 
-    try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=timeout)
-            content = page.content()
-            browser.close()
-            return content
-    except Exception as e:
-        app.logger.warning("Playwright fetch failed for %s: %s", url, e)
-        return None
 
+class _CrawlBudget:
+    """Page budget shared by several crawls running at once."""
 
-def fetch_html(url: str, render_js: bool = False, timeout: int = 10):
-    """Fetch HTML via requests or Playwright (when render_js=True). Returns (html, status)."""
-    headers = {"User-Agent": "PutzelfMarketing/1.0"}
-    if render_js:
-        html = fetch_with_playwright(url, timeout=(timeout * 1000))
-        if html is not None:
-            return html, 200
+    def __init__(self, pages: int):
+        self.remaining = max(0, int(pages))
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+    def charge(self, pages: int) -> None:
+        with self._lock:
+            self.remaining = max(0, self.remaining - int(pages))
+
+
+class _FetchLimiter:
+    """Caps in-flight fetches globally and per host."""
+
+    def __init__(self, concurrency: int, per_host: int):
+        self.concurrency = max(1, int(concurrency))
+        self.per_host = max(1, min(int(per_host), self.concurrency))
+        self._global = threading.BoundedSemaphore(self.concurrency)
+        self._hosts: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _host_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._hosts.get(host)
+            if semaphore is None:
+                semaphore = self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return semaphore
+
+    @contextmanager
+    def slot(self, url: str):
+        # Take the host slot first so a busy host never holds a global slot while waiting.
+        with self._host_semaphore(_normalize_netloc(urlparse(url).netloc)):
+            with self._global:
+                yield
 
-    try:
-        resp = requests.get(url, timeout=timeout, headers=headers)
-        return resp.text, resp.status_code
-    except Exception as e:
-        app.logger.warning("requests.get failed for %s: %s", url, e)
-        return "", 0
 
+_http_session: requests.Session | None = None
+_http_session_pool_size = 0
+_http_session_lock = threading.Lock()
 
-def crawl(start_url: str, max_pages: int = 100, render_js: bool = False):
+
+class _CrawlFrontier:
+    """Crawl queue ordered by priority, with O(1) membership checks.
+
+    Each URL is queued with a tier (detail, normal or low). Without a ``scorer``
+    detail links pop first, newest first, then normal and low links in the order
+    they were found. With a scorer (see ``_ContactYieldScorer``) a link's score is
+    its tier and anchor text bonus plus the current learned yield of its URL
+    pattern; links are kept in one heap per pattern, so scores stay current as
+    the scorer learns. A heap of the pattern heads' ranks picks the next one; it
+    is updated lazily, when a head or its pattern's learned yield changes.
+
+    Membership is tracked by ``key(url)`` so URL variants of one page are queued once.
     """
-    Crawl collecting emails and phones with stricter phone extraction rules.
+
+    DETAIL = 0
+    NORMAL = 1
+    LOW = 2
+    TIER_NAMES = ("detail", "normal", "low")
+    TIER_SCORES = (2.0, 0.0, -2.0)
+
+    def __init__(self, key: Callable[[str], str] | None = None, scorer: "_ContactYieldScorer | None" = None):
+        # Per URL pattern, heaps of (-base score, order, url, tier, anchor); order breaks ties.
+        self._heaps: dict[str, list[tuple[float, int, str, int, str]]] = {}
+        # (rank, pattern) of pattern heads; entries whose rank is no longer current are skipped.
+        self._best: list[tuple[tuple[float, int], str]] = []
+        self._members: set[str] = set()
+        self._key = key or (lambda url: url)
+        self._scorer = scorer
+        self._sizes = [0, 0, 0]
+        self._seq = 0
+        self.pushed = 0
+        self.duplicates = 0
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, url: str) -> bool:
+        return self._key(url) in self._members
+
+    def _entry_score(self, url: str, tier: int, anchor: str) -> tuple[str, float]:
+        if self._scorer is None:
+            return "", self.TIER_SCORES[tier]
+        return self._scorer.pattern(url), self._scorer.base_score(url, tier, anchor)
+
+    def _add(self, url: str, tier: int, anchor: str, lifo: bool) -> None:
+        self._seq += 1
+        pattern, score = self._entry_score(url, tier, anchor)
+        entry = (-score, -self._seq if lifo else self._seq, url, tier, anchor)
+        heap = self._heaps.setdefault(pattern, [])
+        heapq.heappush(heap, entry)
+        if heap[0] is entry:
+            self._queue_pattern(pattern)
+        self._sizes[tier] += 1
+
+    def _rank(self, pattern: str, entry: tuple) -> tuple[float, int]:
+        learned = self._scorer.yield_score(pattern) if self._scorer is not None else 0.0
+        return entry[0] - learned, entry[1]
+
+    def _head(self, pattern: str) -> tuple | None:
+        heap = self._heaps.get(pattern)
+        return heap[0] if heap else None
+
+    def _patterns(self) -> Iterable[str]:
+        return self._heaps
+
+    def _queue_pattern(self, pattern: str) -> None:
+        head = self._head(pattern)
+        if head is None:
+            return
+        heapq.heappush(self._best, (self._rank(pattern, head), pattern))
+        if len(self._best) > 2 * self._pattern_count() + 64:
+            self._best = [(self._rank(name, self._head(name)), name) for name in self._patterns()]
+            heapq.heapify(self._best)
+
+    def _next_pattern(self) -> str:
+        if self._scorer is not None and self._scorer.changed:
+            for pattern in self._scorer.changed:
+                self._queue_pattern(pattern)
+            self._scorer.changed.clear()
+        while self._best:
+            rank, pattern = heapq.heappop(self._best)
+            head = self._head(pattern)
+            if head is not None and self._rank(pattern, head) == rank:
+                return pattern
+        raise IndexError("pop from an empty frontier")
+
+    def push(self, url: str, tier: int = NORMAL, anchor: str = "") -> bool:
+        key = self._key(url)
+        if key in self._members:
+            self.duplicates += 1
+            return False
+        self._members.add(key)
+        self.pushed += 1
+        # Newest detail links go first among equals, as with the former deque.appendleft().
+        self._add(url, tier, anchor, lifo=tier == self.DETAIL)
+        return True
+
+    def pop(self) -> str:
+        pattern = self._next_pattern()
+        heap = self._heaps[pattern]
+        _, _, url, tier, _ = heapq.heappop(heap)
+        if heap:
+            self._queue_pattern(pattern)
+        else:
+            del self._heaps[pattern]
+        self._members.discard(self._key(url))
+        self._sizes[tier] -= 1
+        return url
+
+    def entries(self) -> list[tuple[str, int, str]]:
+        """Queued ``(url, tier, anchor)`` entries in pop order."""
+        ranked = sorted(
+            (self._rank(pattern, entry), entry) for pattern, heap in self._heaps.items() for entry in heap
+        )
+        return [(url, tier, anchor) for _, (_, _, url, tier, anchor) in ranked]
+
+    def restore(self, entries: Iterable[tuple[str, int, str]]) -> None:
+        """Re-queue entries from ``entries()`` so they pop in the same order, given the same scorer state."""
+        for url, tier, anchor in entries:
+            key = self._key(url)
+            if key in self._members:
+                continue
+            self._members.add(key)
+            self._add(url, tier, anchor, lifo=False)
+
+    def tier_counts(self) -> dict[str, int]:
+        return dict(zip(self.TIER_NAMES, self._sizes))
+
+    def stats(self) -> dict[str, int]:
+        stats = {"size": len(self), **self.tier_counts(), "pushed": self.pushed, "duplicates": self.duplicates}
+        if self._scorer is not None:
+            stats["patterns"] = self._pattern_count()
+        return stats
+
+    def _pattern_count(self) -> int:
+        return len(self._heaps)
+
+
+LOW_VALUE_PATH_SEGMENTS = {
+    "login", "logout", "anmelden", "abmelden", "register", "registrieren", "account", "konto",
+    "cart", "warenkorb", "checkout", "kasse", "search", "suche", "tag", "tags", "feed", "rss",
+    "print", "drucken", "share", "teilen", "newsletter", "wp-admin", "wp-json", "wp-login.php",
+}
+
+
+def _is_low_value_path(path: str) -> bool:
+    return any(segment.lower() in LOW_VALUE_PATH_SEGMENTS for segment in path.split("/") if segment)
+
+
+# Path or anchor-text keywords of pages that usually list a site's contacts, with their score bonus.
+CONTACT_LINK_KEYWORDS = (
+    ("impressum", 3.0), ("imprint", 3.0), ("kontakt", 3.0), ("contact", 3.0), ("offenlegung", 3.0),
+    ("legal-notice", 3.0), ("ueber-uns", 1.5), ("about", 1.5), ("team", 1.5), ("standort", 1.5), ("anfahrt", 1.5),
+)
+CONTACT_YIELD_WEIGHT = 4.0  # score range, around neutral, of a URL pattern's learned contact yield
+
+
+def _yield_path_pattern(path: str) -> str:
+    """URL shape used to learn contact yield, finer than ``_render_path_pattern``.
+
+    The first two segments are kept when they are plain words (hyphens allowed
+    only in the first); anything else becomes ``*``. ``/firmen/wien/cat2/firma-18``
+    becomes ``/firmen/wien/*/*``, ``/blog/mein-erster-post`` becomes ``/blog/*``
+    and ``/ueber-uns/team`` stays as it is.
     """
-    visited = set()
-    queue = deque([start_url])
-    url_map = {}
+    pattern = []
+    for depth, segment in enumerate(segment for segment in path.lower().split("/") if segment):
+        plain = (
+            depth < 2
+            and len(segment) <= 30
+            and not any(ch.isdigit() or ch == "_" for ch in segment)
+            and (depth == 0 or "-" not in segment)
+        )
+        pattern.append(segment if plain else "*")
+    return "/" + "/".join(pattern)
 
-    parsed_start = urlparse(start_url)
-    base_domain = _normalize_netloc(parsed_start.netloc)
-    start_segments = [s for s in parsed_start.path.split("/") if s]
-    phone_region = _infer_region_from_netloc(parsed_start.netloc) or DEFAULT_PHONE_REGION
 
-    VISIBLE_TAGS = ["p", "span", "div", "li", "address", "td", "th"]
+def _contact_keyword_bonus(text: str) -> float:
+    text = re.sub(r"[\s_/]+", "-", text.lower().replace("ü", "ue"))
+    return max((bonus for keyword, bonus in CONTACT_LINK_KEYWORDS if keyword in text), default=0.0)
 
-    def extract_business_name_from_soup(soup_obj: BeautifulSoup | None) -> str:
-      if not soup_obj:
-        return ""
 
-      aggregator_markers = {
-        "herold", "yelp", "google", "maps", "tripadvisor", "foursquare", "yellowpages", "gelbeseiten",
-      }
-      base_label = (base_domain.split(".")[0] if base_domain else "").lower().strip()
-      is_aggregator_domain = any(marker in (base_domain or "") for marker in aggregator_markers)
-
-      def _normalize_name(value: str | None) -> str:
-        text = re.sub(r"\s+", " ", str(value or "")).strip()
-        if not text or len(text) < 2:
-          return ""
-        lowered = text.lower()
-        if lowered in {"home", "startseite", "homepage"}:
-          return ""
-        if base_label and lowered == base_label:
-          return ""
-        if is_aggregator_domain and any(marker == lowered for marker in aggregator_markers):
-          return ""
-        return text
-
-      def _types_from_node(node: dict) -> set[str]:
-        raw_types = node.get("@type")
-        if isinstance(raw_types, str):
-          return {raw_types.lower()}
-        if isinstance(raw_types, list):
-          return {str(t).lower() for t in raw_types}
-        return set()
-
-      def _is_business_like_schema(types: set[str]) -> bool:
-        if "localbusiness" in types:
-          return True
-        business_tokens = (
-          "business", "store", "restaurant", "cafe", "hotel", "bar", "bakery", "lodging", "foodestablishment",
+class _ContactYieldScorer:
+    """Frontier priority for one crawl, learning which URL patterns turn up new contacts.
+
+    A link's base score is its tier plus a bonus when its path or anchor text
+    looks like an Impressum, contact or about page. On top comes how often
+    fetched pages of its URL pattern produced new contacts so far (seeded with
+    ``past`` counts from earlier crawls of the domain); unseen patterns are neutral.
+    """
+
+    def __init__(self, past: dict[str, tuple[int, int]] | None = None):
+        self._counts: dict[str, list[int]] = {pattern: [pages, hits] for pattern, (pages, hits) in (past or {}).items()}
+        self._learned: dict[str, list[int]] = {}
+        # Patterns whose yield changed since the frontier last re-ranked them.
+        self.changed: set[str] = set()
+
+    @staticmethod
+    def pattern(url: str) -> str:
+        return _yield_path_pattern(urlsplit(url).path)
+
+    @staticmethod
+    def base_score(url: str, tier: int, anchor: str = "") -> float:
+        bonus = max(_contact_keyword_bonus(urlsplit(url).path), _contact_keyword_bonus(anchor))
+        return _CrawlFrontier.TIER_SCORES[tier] + bonus
+
+    def yield_score(self, pattern: str) -> float:
+        counts = self._counts.get(pattern)
+        if counts is None:
+            return 0.0
+        pages, hits = counts
+        return CONTACT_YIELD_WEIGHT * ((hits + 1) / (pages + 2) - 0.5)
+
+    def _add(self, pattern: str, pages: int, hits: int) -> None:
+        for table in (self._counts, self._learned):
+            counts = table.setdefault(pattern, [0, 0])
+            counts[0] += pages
+            counts[1] += hits
+        self.changed.add(pattern)
+
+    def record(self, url: str, found: bool) -> None:
+        self._add(self.pattern(url), 1, int(found))
+
+    def learned(self) -> dict[str, tuple[int, int]]:
+        """``(pages, pages with new contacts)`` per pattern recorded in this crawl."""
+        return {pattern: (pages, hits) for pattern, (pages, hits) in self._learned.items()}
+
+    def restore(self, learned: dict[str, tuple[int, int]]) -> None:
+        """Add back the ``learned()`` counts of an interrupted crawl being resumed."""
+        for pattern, (pages, hits) in learned.items():
+            self._add(pattern, pages, hits)
+
+
+class _ContactYieldMemory:
+    """Persistent per-domain contact yield of URL patterns, for ``_ContactYieldScorer``.
+
+    Records older than ``ttl`` seconds are ignored and start over when updated.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS contact_yield (
+              domain TEXT NOT NULL,
+              pattern TEXT NOT NULL,
+              pages INTEGER NOT NULL DEFAULT 0,
+              hits INTEGER NOT NULL DEFAULT 0,
+              updated_at REAL NOT NULL,
+              PRIMARY KEY (domain, pattern)
+            )
+            """
         )
-        return any(any(token in t for token in business_tokens) for t in types)
 
-      candidates: list[tuple[int, str]] = []
+    def load(self, domain: str) -> dict[str, tuple[int, int]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT pattern, pages, hits FROM contact_yield WHERE domain = ? AND updated_at > ?",
+                (domain, datetime.now().timestamp() - self.ttl),
+            ).fetchall()
+        return {pattern: (pages, hits) for pattern, pages, hits in rows}
+
+    def record(self, domain: str, counts: dict[str, tuple[int, int]]) -> None:
+        now = datetime.now().timestamp()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO contact_yield (domain, pattern, pages, hits, updated_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (domain, pattern) DO UPDATE SET"
+                " pages = CASE WHEN updated_at > ? THEN pages + excluded.pages ELSE excluded.pages END,"
+                " hits = CASE WHEN updated_at > ? THEN hits + excluded.hits ELSE excluded.hits END,"
+                " updated_at = excluded.updated_at",
+                [
+                    (domain, pattern, pages, hits, now, now - self.ttl, now - self.ttl)
+                    for pattern, (pages, hits) in counts.items()
+                ],
+            )
 
-      # 1) JSON-LD (prefer listing-level business entities over portal org)
-      for script in soup_obj.find_all("script", attrs={"type": "application/ld+json"}):
-        content = (script.string or script.get_text("", strip=True) or "").strip()
-        if not content:
-          continue
-        try:
-          payload = json.loads(content)
-        except Exception:
-          continue
 
-        stack = [payload]
-        while stack:
-          node = stack.pop()
-          if isinstance(node, list):
-            stack.extend(node)
-            continue
-          if not isinstance(node, dict):
-            continue
+_contact_yield_memory: _ContactYieldMemory | None = None
+_contact_yield_memory_lock = threading.Lock()
+_contact_yield_memory_failed = False
 
-          node_types = _types_from_node(node)
-          name_val = node.get("legalName") or node.get("name")
-          name = _normalize_name(name_val if isinstance(name_val, str) else "")
-          if name:
-            score = 0
-            if _is_business_like_schema(node_types):
-              score += 120
-            elif "organization" in node_types:
-              score += 20
-            if node.get("address") or node.get("telephone") or node.get("email"):
-              score += 20
-            if score > 0:
-              candidates.append((score, name))
-
-          item_list = node.get("itemListElement")
-          if isinstance(item_list, list):
-            for item in item_list:
-              entry = item.get("item") if isinstance(item, dict) else None
-              if isinstance(entry, dict):
-                entry_name = _normalize_name(entry.get("name") if isinstance(entry.get("name"), str) else "")
-                if entry_name:
-                  candidates.append((110, entry_name))
-
-          stack.extend(node.values())
-
-      if candidates:
-        candidates.sort(key=lambda pair: (pair[0], len(pair[1])), reverse=True)
-        return candidates[0][1]
-
-      # 2) Visible listing content fallback (h1/itemprop/class-based)
-      selector_candidates = [
-        ('[itemprop="name"]', 95),
-        ("h1", 90),
-        ('[class*="business"][class*="name"]', 85),
-        ('[class*="company"][class*="name"]', 85),
-        ('[class*="listing"][class*="title"]', 80),
-        ('[class*="entry"][class*="title"]', 80),
-        ('[class*="result"][class*="title"]', 75),
-      ]
-      for selector, score in selector_candidates:
-        for el in soup_obj.select(selector):
-          text = _normalize_name(el.get_text(" ", strip=True))
-          if text:
-            candidates.append((score, text))
-            break
-        if candidates:
-          break
 
-      # 3) Title fallback (avoid site/platform labels)
-      title_tag = soup_obj.find("title")
-      if title_tag:
-        title_text = _normalize_name(title_tag.get_text(" ", strip=True))
-        if title_text:
-          for sep in ("|", " - ", " – ", " :: "):
-            parts = [p.strip() for p in title_text.split(sep) if p.strip()]
-            for part in parts:
-              normalized_part = _normalize_name(part)
-              if normalized_part and normalized_part.lower() != base_label:
-                candidates.append((70, normalized_part))
-                break
-            if candidates:
-              break
-          if not candidates:
-            candidates.append((60, title_text))
+def _get_contact_yield_memory() -> _ContactYieldMemory | None:
+    """Return the shared contact yield memory, or None when it is disabled or cannot be opened."""
+    global _contact_yield_memory, _contact_yield_memory_failed
+    if not CRAWLER_CONTACT_PRIORITY or _contact_yield_memory_failed:
+        return None
+    with _contact_yield_memory_lock:
+        if _contact_yield_memory is None:
+            try:
+                _contact_yield_memory = _ContactYieldMemory(
+                    os.path.join(CRAWLER_DATA_DIR, "contact_yield.sqlite3"),
+                    CRAWLER_CONTACT_MEMORY_DAYS * 86400,
+                )
+            except (OSError, sqlite3.Error) as exc:
+                app.logger.warning("Contact yield memory disabled: %s", exc)
+                _contact_yield_memory_failed = True
+                return None
+        return _contact_yield_memory
 
-      if candidates:
-        candidates.sort(key=lambda pair: (pair[0], len(pair[1])), reverse=True)
-        return candidates[0][1]
 
-      return ""
+_STRIP_QUERY_KEYS = frozenset(key for key in CRAWLER_STRIP_QUERY_PARAMS if not key.endswith("*"))
+_STRIP_QUERY_PREFIXES = tuple(key[:-1] for key in CRAWLER_STRIP_QUERY_PARAMS if key.endswith("*"))
+_PATH_SESSION_REGEX = re.compile(r";(?:jsessionid|phpsessid|sid)=[^/?#]*", re.IGNORECASE)
+_DEFAULT_PORTS = {"http": 80, "https": 443}
 
-    def is_probable_detail_path(path: str) -> bool:
-        segs = [s for s in path.split("/") if s]
-        if not segs:
-            return False
-        if len(segs) == 1 and "_" in segs[0] and not segs[0].startswith("_assets"):
-            return True
-        if len(segs) > 2 and segs[0] == "firmen":
-            return True
-        return False
 
-    def enqueue(u: str, left: bool = False):
-        if u in visited or u in queue:
-            return
-        if left:
-            queue.appendleft(u)
-        else:
-            queue.append(u)
-
-    def fallback_business_name_from_url(raw_url: str) -> str:
-      netloc = (urlparse(raw_url).netloc or "").lower().strip()
-      if netloc.startswith("www."):
-        netloc = netloc[4:]
-      if any(marker in netloc for marker in ("herold", "yelp", "google", "maps", "tripadvisor", "foursquare", "yellowpages", "gelbeseiten")):
-        return ""
-      if not netloc:
-        return ""
-      host_label = netloc.split(".")[0]
-      if not host_label:
-        return ""
-      cleaned = re.sub(r"[^a-z0-9]+", " ", host_label, flags=re.IGNORECASE).strip()
-      return cleaned.title() if cleaned else ""
-
-    while queue and len(visited) < max_pages:
-        url = urldefrag(queue.popleft()).url
-
-        if url in visited:
-            continue
+def _is_ignored_query_param(key: str) -> bool:
+    lowered = key.lower()
+    return lowered in _STRIP_QUERY_KEYS or bool(_STRIP_QUERY_PREFIXES and lowered.startswith(_STRIP_QUERY_PREFIXES))
 
-        parsed = urlparse(url)
-        if _normalize_netloc(parsed.netloc) != base_domain:
-            app.logger.debug("Skipping external host: %s", url)
-            continue
 
-        visited.add(url)
-        app.logger.info("Crawling: %s", url)
+def canonicalize_url(url: str) -> str:
+    """Normalize a crawl URL so parameter and spelling variants of a page become one string.
+
+    Drops the fragment and the CRAWLER_STRIP_QUERY_PARAMS keys (tracking and
+    session ids by default), sorts the remaining query pairs by key without
+    re-encoding them, lowercases scheme and host and removes default ports. Disabled (fragment removal only) with CRAWLER_CANONICALIZE=false.
+    """
+    url = urldefrag((url or "").strip()).url
+    if not CRAWLER_CANONICALIZE:
+        return url
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and _DEFAULT_PORTS.get(scheme) == port:
+        netloc = netloc.rsplit(":", 1)[0]
+    path = _PATH_SESSION_REGEX.sub("", parts.path) or "/"
+    # Filter the raw pairs rather than re-encoding them: the result is the URL
+    # that gets fetched, so "?print", "a=1;b=2" and "%20" must survive as written.
+    pairs = [
+        pair
+        for pair in parts.query.split("&")
+        if pair and not _is_ignored_query_param(unquote_plus(pair.split("=", 1)[0]))
+    ]
+    pairs.sort(key=lambda pair: pair.split("=", 1)[0])
+    return urlunsplit((scheme, netloc, path, "&".join(pairs), ""))
+
+
+def _url_key(url: str) -> str:
+    """Identity of a canonical URL for dedup: ignores scheme, ``www.`` and a trailing slash."""
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/") or "/"
+    key = _normalize_netloc(parts.netloc) + path
+    return f"{key}?{parts.query}" if parts.query else key
+
+
+def _find_canonical_url(soup: BeautifulSoup, page_url: str) -> str | None:
+    """Canonicalized target of the page's ``<link rel="canonical">``, if any."""
+    tag = soup.find("link", rel="canonical", href=True)
+    href = tag["href"].strip() if tag is not None else ""
+    if not href:
+        return None
+    canonical = canonicalize_url(urljoin(page_url, href))
+    if urlsplit(canonical).scheme not in ("http", "https"):
+        return None
+    return canonical
+
+
+_INVISIBLE_BLOCK_REGEX = re.compile(
+    r"<(script|style|noscript|template|svg)\b.*?</\1\s*>|<!--.*?-->", re.IGNORECASE | re.DOTALL
+)
+_TAG_REGEX = re.compile(r"<[^>]+>")
+_DIGIT_RUN_REGEX = re.compile(r"\d+")
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4
+
+
+def _visible_text(raw_html: str | None) -> str:
+    """Cheap regex approximation of a page's visible text, for fingerprinting only."""
+    text = _INVISIBLE_BLOCK_REGEX.sub(" ", raw_html or "")
+    text = html.unescape(_TAG_REGEX.sub(" ", text))
+    return " ".join(text.split())
+
+
+def _fingerprint_text(text: str) -> str:
+    """Lower-case text with digit runs folded, so timestamps and counters do not change the fingerprint."""
+    return _DIGIT_RUN_REGEX.sub("0", text.lower())
+
+
+def _simhash(text: str) -> int:
+    """64-bit simhash over word trigrams."""
+    words = text.split()
+    shingles = [" ".join(words[i:i + 3]) for i in range(max(1, len(words) - 2))]
+    weights = [0] * SIMHASH_BITS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def _contact_signature(raw_html: str | None, text: str) -> str:
+    """Digest of the emails and phone-like numbers on a page; pages with different contacts never match."""
+    tokens = {email.lower() for email in EMAIL_REGEX.findall(raw_html or "")}
+    for match in PHONE_TOKEN_REGEX.finditer(text):
+        candidate = match.group().strip()
+        digits = _NON_DIGIT_REGEX.sub("", candidate)
+        if candidate[:1] in "+0" and len(digits) >= 7 and not _looks_like_date_sequence(candidate, digits):
+            tokens.add(digits)
+    return hashlib.blake2b("\n".join(sorted(tokens)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Exact text key, simhash band keys and simhash of one page (see _NearDuplicateIndex.fingerprint).
+_PageFingerprint = tuple[tuple[str, str], list[tuple[str, int, int]], int | None]
+
+
+class _NearDuplicateIndex:
+    """Fingerprints of processed pages: exact text hash plus simhash, bucketed by contact signature.
+
+    A page is a near-duplicate when an earlier page has the same contacts and
+    either identical visible text or a simhash within ``max_distance`` bits.
+    Simhashes are banded so a lookup only compares pages sharing a band.
+    With ``window`` only the most recent pages are remembered.
+    """
+
+    def __init__(self, max_distance: int = 3, window: int | None = None):
+        self.max_distance = max(0, min(int(max_distance), SIMHASH_BANDS - 1))
+        self.window = window
+        self._exact: dict[tuple[str, str], str] = {}
+        self._bands: dict[tuple[str, int, int], list[tuple[int, str]]] = {}
+        self._order: deque = deque()
+        self._lock = threading.Lock()
+
+    def _forget_oldest(self) -> None:
+        exact_key, band_keys, fingerprint, url = self._order.popleft()
+        self._exact.pop(exact_key, None)
+        for band_key in band_keys:
+            bucket = self._bands.get(band_key)
+            if bucket is None:
+                continue
+            bucket.remove((fingerprint, url))
+            if not bucket:
+                del self._bands[band_key]
+
+    def fingerprint(self, raw_html: str | None) -> _PageFingerprint:
+        """Exact key, simhash band keys and simhash of a page; safe to compute in any thread."""
+        text = _visible_text(raw_html)
+        signature = _contact_signature(raw_html, text)
+        text = _fingerprint_text(text)
+        exact_key = (signature, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest())
+        if not self.max_distance:
+            return exact_key, [], None
+        fingerprint = _simhash(text)
+        band_width = SIMHASH_BITS // SIMHASH_BANDS
+        band_mask = (1 << band_width) - 1
+        band_keys = [(signature, band, fingerprint >> (band * band_width) & band_mask) for band in range(SIMHASH_BANDS)]
+        return exact_key, band_keys, fingerprint
+
+    def find(self, fingerprint: _PageFingerprint) -> str | None:
+        """Return the URL of a remembered near-duplicate of the fingerprinted page, if any."""
+        exact_key, band_keys, simhash = fingerprint
+        with self._lock:
+            original = self._exact.get(exact_key)
+            if original is not None:
+                return original
+            for band_key in band_keys:
+                for other, other_url in self._bands.get(band_key, ()):
+                    if (simhash ^ other).bit_count() <= self.max_distance:
+                        return other_url
+        return None
+
+    def add(self, url: str, fingerprint: _PageFingerprint) -> None:
+        """Remember a page; callers add pages in a fixed order to keep decisions reproducible."""
+        exact_key, band_keys, simhash = fingerprint
+        with self._lock:
+            for band_key in band_keys:
+                self._bands.setdefault(band_key, []).append((simhash, url))
+            self._exact[exact_key] = url
+            if self.window is not None:
+                self._order.append((exact_key, band_keys, simhash, url))
+                if len(self._order) > self.window:
+                    self._forget_oldest()
+
+
+def _resolve_html_parser(preferred: str) -> str:
+    """Pick the first installed BeautifulSoup tree builder for ``preferred``, falling back to html.parser."""
+    candidates = {
+        "auto": ("lxml",),
+        "lxml": ("lxml",),
+        "html5lib": ("html5lib",),
+    }.get(preferred, ())
+    for name in candidates:
+        try:
+            __import__(name)
+        except ImportError:
+            if preferred != "auto":
+                app.logger.warning("HTML parser %s is not installed; falling back to html.parser", name)
+            continue
+        return name
+    return "html.parser"
+
+
+_CRAWL_HTML_PARSER = _resolve_html_parser(CRAWLER_HTML_PARSER)
+# Everything the extractors read: visible body content, the <title>, JSON-LD scripts and
+# <link rel=canonical>. Other head-only markup (meta, style) is never turned into tree nodes.
+_CRAWL_PARSE_STRAINER = SoupStrainer(["body", "title", "script", "link"])
+
+
+def _make_soup(html: str | None, *, strained: bool | None = None) -> BeautifulSoup:
+    if strained is None:
+        strained = CRAWLER_STRAINED_PARSE
+    parse_only = _CRAWL_PARSE_STRAINER if strained else None
+    return BeautifulSoup(html or "", _CRAWL_HTML_PARSER, parse_only=parse_only)
+
+
+VISIBLE_TEXT_TAGS = frozenset({"p", "span", "div", "li", "address", "td", "th"})
+VISIBLE_TEXT_MAX_LENGTH = 300
+ANCHOR_TEXT_MAX_LENGTH = 80
+PHONE_ATTRIBUTE_MARKERS = ("tel", "phone", "kontakt", "mobil", "fax")
+_ATTRIBUTE_SCAN_SKIP_TAGS = frozenset({"script", "style", "noscript", "svg"})
+# Matches Tag.get_text(): comments, script/style and template strings are not visible text.
+_VISIBLE_STRING_TYPES = (NavigableString, CData)
+
+
+def _extract_page_contacts(
+    soup: BeautifulSoup,
+    region: str | None,
+    *,
+    include_attributes: bool = True,
+    phone_stats: Counter | None = None,
+) -> tuple[set[str], set[str], list[str], list[str]]:
+    """
+    Walk the parsed page once and collect tel:/mailto: contacts, labelled phone
+    numbers in short visible text blocks, phone-like attribute values and the
+    raw href and anchor text of every link.
+
+    Returns ``(emails, phones, hrefs, anchors)``; ``emails`` only holds mailto:
+    addresses, ``hrefs`` keeps document order and ``anchors[i]`` is the visible
+    text (or title) of the link to ``hrefs[i]``, cut to ``ANCHOR_TEXT_MAX_LENGTH``.
+    """
+    emails: set[str] = set()
+    phones: set[str] = set()
+    hrefs: list[str] = []
+    anchors: list[str] = []
+    link_slots: dict[int, int] = {}
+
+    # Stripped visible strings in document order plus their running length, so the
+    # get_text(" ", strip=True) length of any element is known without joining it.
+    strings: list[str] = []
+    offsets: list[int] = [0]
+    scanned_texts: set[str] = set()
+
+    def scan_text(value: str) -> None:
+        if value in scanned_texts:
+            return
+        scanned_texts.add(value)
+        phones.update(find_labelled_phones(value, region=region, stats=phone_stats))
+
+    def visit_tag(tag: Tag) -> None:
+        attrs = tag.attrs
+        if tag.name == "a" and attrs.get("href") is not None:
+            href = attrs["href"].strip()
+            link_slots[id(tag)] = len(hrefs)
+            hrefs.append(href)
+            title = attrs.get("title")
+            anchors.append(title.strip()[:ANCHOR_TEXT_MAX_LENGTH] if isinstance(title, str) else "")
+            lowered = href.lower()
+            if lowered.startswith("tel:"):
+                n = normalize_phone(href[4:].split("?")[0].strip(), region=region)
+                if n:
+                    phones.add(n)
+            elif lowered.startswith("mailto:"):
+                addr = href[7:].split("?")[0].strip()
+                if EMAIL_REGEX.match(addr):
+                    emails.add(addr)
+
+        # Same selection as the former find_all(attrs=True) sweep, which bs4 treats
+        # as a filter on the class attribute.
+        if not include_attributes or "class" not in attrs or tag.name in _ATTRIBUTE_SCAN_SKIP_TAGS:
+            return
+        for attr, val in attrs.items():
+            if isinstance(val, str):
+                lower_attr = attr.lower()
+                if lower_attr == "style":
+                    continue
+                if any(k in lower_attr for k in PHONE_ATTRIBUTE_MARKERS):
+                    n = normalize_phone(val, region=region)
+                    if n:
+                        phones.add(n)
+                else:
+                    scan_text(val)
+            elif isinstance(val, (list, tuple)):
+                for part in val:
+                    scan_text(str(part))
+
+    stack: list[tuple[Tag, Any, int]] = [(soup, iter(soup.contents), 0)]
+    while stack:
+        node, children, first_string = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            count = len(strings) - first_string
+            if count and node.name == "a" and id(node) in link_slots:
+                anchors[link_slots[id(node)]] = " ".join(strings[first_string:])[:ANCHOR_TEXT_MAX_LENGTH]
+            if count and node.name in VISIBLE_TEXT_TAGS:
+                length = offsets[-1] - offsets[first_string] + count - 1
+                if length <= VISIBLE_TEXT_MAX_LENGTH:
+                    scan_text(" ".join(strings[first_string:]))
+            continue
+        if isinstance(child, Tag):
+            visit_tag(child)
+            stack.append((child, iter(child.contents), len(strings)))
+        elif type(child) in _VISIBLE_STRING_TYPES:
+            stripped = child.strip()
+            if stripped:
+                strings.append(stripped)
+                offsets.append(offsets[-1] + len(stripped))
+
+    return emails, phones, hrefs, anchors
+
+
+def _extract_business_name(soup_obj: BeautifulSoup | None, base_domain: str) -> str:
+  """Best business name on a crawled page: JSON-LD entities, then headings, then the title."""
+  if not soup_obj:
+    return ""
+
+  aggregator_markers = {
+    "herold", "yelp", "google", "maps", "tripadvisor", "foursquare", "yellowpages", "gelbeseiten",
+  }
+  base_label = (base_domain.split(".")[0] if base_domain else "").lower().strip()
+  is_aggregator_domain = any(marker in (base_domain or "") for marker in aggregator_markers)
+
+  def _normalize_name(value: str | None) -> str:
+    text = re.sub(r"\s+", " ", str(value or "")).strip()
+    if not text or len(text) < 2:
+      return ""
+    lowered = text.lower()
+    if lowered in {"home", "startseite", "homepage"}:
+      return ""
+    if base_label and lowered == base_label:
+      return ""
+    if is_aggregator_domain and any(marker == lowered for marker in aggregator_markers):
+      return ""
+    return text
+
+  def _types_from_node(node: dict) -> set[str]:
+    raw_types = node.get("@type")
+    if isinstance(raw_types, str):
+      return {raw_types.lower()}
+    if isinstance(raw_types, list):
+      return {str(t).lower() for t in raw_types}
+    return set()
+
+  def _is_business_like_schema(types: set[str]) -> bool:
+    if "localbusiness" in types:
+      return True
+    business_tokens = (
+      "business", "store", "restaurant", "cafe", "hotel", "bar", "bakery", "lodging", "foodestablishment",
+    )
+    return any(any(token in t for token in business_tokens) for t in types)
+
+  candidates: list[tuple[int, str]] = []
+
+  # 1) JSON-LD (prefer listing-level business entities over portal org)
+  for script in soup_obj.find_all("script", attrs={"type": "application/ld+json"}):
+    content = (script.string or script.get_text("", strip=True) or "").strip()
+    if not content:
+      continue
+    try:
+      payload = json.loads(content)
+    except Exception:
+      continue
+
+    stack = [payload]
+    while stack:
+      node = stack.pop()
+      if isinstance(node, list):
+        stack.extend(node)
+        continue
+      if not isinstance(node, dict):
+        continue
+
+      node_types = _types_from_node(node)
+      name_val = node.get("legalName") or node.get("name")
+      name = _normalize_name(name_val if isinstance(name_val, str) else "")
+      if name:
+        score = 0
+        if _is_business_like_schema(node_types):
+          score += 120
+        elif "organization" in node_types:
+          score += 20
+        if node.get("address") or node.get("telephone") or node.get("email"):
+          score += 20
+        if score > 0:
+          candidates.append((score, name))
+
+      item_list = node.get("itemListElement")
+      if isinstance(item_list, list):
+        for item in item_list:
+          entry = item.get("item") if isinstance(item, dict) else None
+          if isinstance(entry, dict):
+            entry_name = _normalize_name(entry.get("name") if isinstance(entry.get("name"), str) else "")
+            if entry_name:
+              candidates.append((110, entry_name))
+
+      stack.extend(node.values())
+
+  if candidates:
+    candidates.sort(key=lambda pair: (pair[0], len(pair[1])), reverse=True)
+    return candidates[0][1]
+
+  # 2) Visible listing content fallback (h1/itemprop/class-based)
+  selector_candidates = [
+    ('[itemprop="name"]', 95),
+    ("h1", 90),
+    ('[class*="business"][class*="name"]', 85),
+    ('[class*="company"][class*="name"]', 85),
+    ('[class*="listing"][class*="title"]', 80),
+    ('[class*="entry"][class*="title"]', 80),
+    ('[class*="result"][class*="title"]', 75),
+  ]
+  for selector, score in selector_candidates:
+    for el in soup_obj.select(selector):
+      text = _normalize_name(el.get_text(" ", strip=True))
+      if text:
+        candidates.append((score, text))
+        break
+    if candidates:
+      break
+
+  # 3) Title fallback (avoid site/platform labels)
+  title_tag = soup_obj.find("title")
+  if title_tag:
+    title_text = _normalize_name(title_tag.get_text(" ", strip=True))
+    if title_text:
+      for sep in ("|", " - ", " – ", " :: "):
+        parts = [p.strip() for p in title_text.split(sep) if p.strip()]
+        for part in parts:
+          normalized_part = _normalize_name(part)
+          if normalized_part and normalized_part.lower() != base_label:
+            candidates.append((70, normalized_part))
+            break
+        if candidates:
+          break
+      if not candidates:
+        candidates.append((60, title_text))
+
+  if candidates:
+    candidates.sort(key=lambda pair: (pair[0], len(pair[1])), reverse=True)
+    return candidates[0][1]
+
+  return ""
+
+
+def _extract_page(
+    html_text: str | None,
+    url: str,
+    base_domain: str,
+    region: str | None,
+    include_attributes: bool = True,
+) -> dict[str, Any]:
+    """Parse a fetched page and return its business name, contacts, links with anchor texts and rel=canonical.
+
+    Module-level and free of crawl state so it can run in an extraction worker process;
+    ``phone_candidates`` holds its find_labelled_phones() stage counts for the caller.
+    """
+    soup = _make_soup(html_text)
+    business_name = _extract_business_name(soup, base_domain)
+    phone_stats: Counter = Counter()
+    emails, phones, hrefs, anchors = _extract_page_contacts(
+        soup, region, include_attributes=include_attributes, phone_stats=phone_stats
+    )
+    emails.update(EMAIL_REGEX.findall(html_text or ""))
+    return {
+        "business_name": business_name,
+        "emails": sorted(emails),
+        "phones": sorted(phones),
+        "hrefs": hrefs,
+        "anchors": anchors,
+        "canonical": _find_canonical_url(soup, url),
+        "phone_candidates": dict(phone_stats),
+    }
+
+
+def _extract_pages(batch: list[tuple]) -> list[Any]:
+    """Worker entry point: ``_extract_page`` over a chunk, returning each page's result or exception."""
+    results: list[Any] = []
+    for args in batch:
+        try:
+            results.append(_extract_page(*args))
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+def _get_http_session(pool_size: int | None = None) -> requests.Session:
+    """Return the shared keep-alive session, growing its pools to ``pool_size`` connections."""
+    global _http_session, _http_session_pool_size
+    wanted = max(int(pool_size or 0), CRAWLER_CONCURRENCY)
+    with _http_session_lock:
+        if _http_session is None:
+            _http_session = requests.Session()
+            _http_session.headers.update(
+                {
+                    "User-Agent": CRAWLER_USER_AGENT,
+                    # Advertises br as well when brotli is installed; urllib3 decodes it transparently.
+                    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+                }
+            )
+        if wanted > _http_session_pool_size:
+            retry = Retry(
+                total=CRAWLER_HTTP_RETRIES,
+                backoff_factor=0.5,
+                # 429/503 are left to the politeness scheduler, which backs off per host.
+                status_forcelist=(500, 502, 504),
+                respect_retry_after_header=False,
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=wanted, pool_maxsize=wanted, max_retries=retry)
+            _http_session.mount("http://", adapter)
+            _http_session.mount("https://", adapter)
+            _http_session_pool_size = wanted
+        return _http_session
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class _PolitenessScheduler:
+    """Per-host token buckets shared by every crawl in this process.
+
+    Each host starts at ``rate`` requests per second, capped by robots.txt
+    ``Crawl-delay`` / ``Request-rate``. With ``rate`` 0 a host without such a
+    robots.txt rule is not paced at all until it throttles us. A 429 or 503
+    halves the host's rate (an unpaced host drops to half of ``max_rate``) and
+    pauses it for ``Retry-After`` (or an exponential backoff); every
+    ``speedup_after`` healthy responses raise it by a quarter again, up to the cap.
+    """
+
+    THROTTLE_STATUSES = frozenset({429, 503})
+
+    def __init__(
+        self,
+        rate: float,
+        max_rate: float,
+        burst: int,
+        *,
+        min_rate: float = 0.2,
+        max_backoff: float = 120.0,
+        speedup_after: int = 10,
+    ):
+        self.rate = max(min_rate, float(rate)) if rate > 0 else 0.0
+        self.max_rate = max(self.rate, float(max_rate))
+        self.burst = max(1, int(burst))
+        self.min_rate = float(min_rate)
+        self.max_backoff = float(max_backoff)
+        self.speedup_after = max(1, int(speedup_after))
+        self._hosts: dict[str, dict[str, Any]] = {}
+        self._robots: dict[str, RobotFileParser | None] = {}
+        self._lock = threading.Lock()
+        self._robots_locks: dict[str, threading.Lock] = {}
+        self._stats: Counter = Counter()
+
+    def robots(self, url: str) -> RobotFileParser | None:
+        """Parsed robots.txt for ``url``'s host (fetched once), or None when unavailable."""
+        parsed = urlparse(url)
+        host = _normalize_netloc(parsed.netloc)
+        with self._lock:
+            if host in self._robots:
+                return self._robots[host]
+            host_lock = self._robots_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            with self._lock:
+                if host in self._robots:
+                    return self._robots[host]
+            parser = None
+            try:
+                resp = _get_http_session().get(f"{parsed.scheme}://{parsed.netloc}/robots.txt", timeout=5)
+                if resp.status_code == 200:
+                    parser = RobotFileParser()
+                    parser.parse(resp.text.splitlines())
+                    parser.modified()  # crawl_delay()/can_fetch() ignore parsers that were never "read"
+            except Exception as e:
+                app.logger.debug("robots.txt unavailable for %s: %s", host, e)
+            with self._lock:
+                self._robots[host] = parser
+            return parser
+
+    def _host_state(self, url: str) -> dict[str, Any]:
+        host = _normalize_netloc(urlparse(url).netloc)
+        with self._lock:
+            state = self._hosts.get(host)
+        if state is not None:
+            return state
+
+        ceiling = self.max_rate
+        burst = self.burst
+        paced = bool(self.rate)
+        robots = self.robots(url)
+        if robots is not None:
+            delay = robots.crawl_delay(CRAWLER_USER_AGENT)
+            request_rate = robots.request_rate(CRAWLER_USER_AGENT)
+            if delay:
+                ceiling = min(ceiling, 1.0 / float(delay))
+                burst = 1
+                paced = True
+            if request_rate and request_rate.seconds:
+                ceiling = min(ceiling, request_rate.requests / request_rate.seconds)
+                burst = 1
+                paced = True
+        ceiling = max(ceiling, 1.0 / self.max_backoff)
+        # A rate of 0 marks an unpaced host.
+        rate = min(self.rate or ceiling, ceiling) if paced else 0.0
+        with self._lock:
+            return self._hosts.setdefault(
+                host,
+                {
+                    "host": host,
+                    "rate": rate,
+                    "ceiling": ceiling,
+                    "burst": burst,
+                    "tokens": float(burst),
+                    "stamp": monotonic(),
+                    "blocked_until": 0.0,
+                    "strikes": 0,
+                    "streak": 0,
+                },
+            )
+
+    def wait(self, url: str) -> float:
+        """Block until ``url``'s host may receive another request; returns the seconds waited."""
+        state = self._host_state(url)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = monotonic()
+                state["tokens"] = min(state["burst"], state["tokens"] + (now - state["stamp"]) * state["rate"])
+                state["stamp"] = now
+                if now < state["blocked_until"]:
+                    delay = state["blocked_until"] - now
+                elif not state["rate"] or state["tokens"] >= 1.0:
+                    if state["rate"]:
+                        state["tokens"] -= 1.0
+                    if waited:
+                        self._stats["waits"] += 1
+                        self._stats["wait_ms"] += int(waited * 1000)
+                    return waited
+                else:
+                    delay = (1.0 - state["tokens"]) / state["rate"]
+            sleep(delay)
+            waited += delay
+
+    def record(self, url: str, status: int, retry_after: str | None = None) -> None:
+        """Adapt the host's rate to a response status."""
+        state = self._host_state(url)
+        with self._lock:
+            if status in self.THROTTLE_STATUSES:
+                delay = _parse_retry_after(retry_after)
+                if delay is None:
+                    delay = 2.0 ** state["strikes"]
+                delay = min(delay, self.max_backoff)
+                state["strikes"] += 1
+                state["streak"] = 0
+                state["rate"] = max(min(self.min_rate, state["ceiling"]), (state["rate"] or state["ceiling"]) / 2)
+                state["tokens"] = 0.0
+                state["blocked_until"] = max(state["blocked_until"], monotonic() + delay)
+                self._stats["throttled"] += 1
+                app.logger.info(
+                    "Throttled by %s (%s); pausing %.1fs, rate now %.2f/s", state["host"], status, delay, state["rate"]
+                )
+            elif 200 <= status < 400 or status == 404:
+                state["strikes"] = 0
+                state["streak"] += 1
+                if state["streak"] >= self.speedup_after and 0 < state["rate"] < state["ceiling"]:
+                    state["rate"] = min(state["ceiling"], state["rate"] * 1.25)
+                    state["streak"] = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "rates": {host: round(state["rate"], 2) for host, state in self._hosts.items()},
+            }
+
+
+_politeness: _PolitenessScheduler | None = None
+_politeness_lock = threading.Lock()
+
+
+def _get_politeness() -> _PolitenessScheduler:
+    global _politeness
+    with _politeness_lock:
+        if _politeness is None:
+            _politeness = _PolitenessScheduler(
+                CRAWLER_HOST_RATE,
+                CRAWLER_HOST_MAX_RATE,
+                CRAWLER_PER_HOST_CONCURRENCY,
+                max_backoff=CRAWLER_MAX_BACKOFF,
+            )
+        return _politeness
+
+
+def _sitemap_locations(start_url: str, politeness: _PolitenessScheduler) -> list[str]:
+    """Sitemaps announced in robots.txt, falling back to ``/sitemap.xml``."""
+    robots = politeness.robots(start_url)
+    listed = robots.site_maps() if robots is not None else None
+    if listed:
+        return list(dict.fromkeys(listed))
+    parsed = urlparse(start_url)
+    return [f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"]
+
+
+def _iter_sitemap_urls(
+    locations: list[str],
+    politeness: _PolitenessScheduler,
+    *,
+    max_files: int | None = None,
+    timeout: int = 10,
+    cancel_event: threading.Event | None = None,
+    deadline: float | None = None,
+):
+    """Yield page URLs from sitemaps, following sitemap indexes breadth-first.
+
+    Each file is streamed through an incremental XML parser (gunzipped when it
+    is a ``.gz`` sitemap) and parsed elements are dropped as soon as they are
+    read, so memory stays flat and the caller can stop at any point. The walk
+    also stops between files and between chunks once ``cancel_event`` is set or
+    the monotonic ``deadline`` has passed.
+    """
+    max_files = CRAWLER_SITEMAP_MAX_FILES if max_files is None else max_files
+    pending = deque(locations)
+    fetched: set[str] = set()
+
+    def stopped() -> bool:
+        if cancel_event is not None and cancel_event.is_set():
+            return True
+        return deadline is not None and monotonic() >= deadline
+
+    while pending and len(fetched) < max_files:
+        if stopped():
+            app.logger.info("Sitemap walk stopped with %d files read", len(fetched))
+            return
+        location = pending.popleft()
+        if location in fetched:
+            continue
+        fetched.add(location)
+        politeness.wait(location)
+        try:
+            resp = _get_http_session().get(location, timeout=timeout, stream=True)
+        except Exception as e:
+            app.logger.debug("Sitemap fetch failed for %s: %s", location, e)
+            continue
+        with resp:
+            politeness.record(location, resp.status_code, resp.headers.get("Retry-After"))
+            if resp.status_code != 200:
+                app.logger.debug("Sitemap %s returned %s", location, resp.status_code)
+                continue
+            parser = XMLPullParser(events=("start", "end"))
+            stack: list[Any] = []
+            inflater = None
+            size = 0
+            try:
+                for chunk in resp.iter_content(chunk_size=64 * 1024):
+                    if stopped():
+                        app.logger.info("Sitemap walk stopped while reading %s", location)
+                        return
+                    if inflater is None:
+                        # Content-Encoding is undone by requests; this catches gzip files served as-is.
+                        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS) if chunk[:2] == b"\x1f\x8b" else False
+                    if inflater:
+                        chunk = inflater.decompress(chunk)
+                    size += len(chunk)
+                    if size > SITEMAP_MAX_BYTES:
+                        app.logger.warning("Sitemap %s exceeds %d bytes; stopping", location, SITEMAP_MAX_BYTES)
+                        break
+                    parser.feed(chunk)
+                    for event, elem in parser.read_events():
+                        if event == "start":
+                            stack.append(elem)
+                            continue
+                        stack.pop()
+                        name = elem.tag.rpartition("}")[2]
+                        parent = stack[-1].tag.rpartition("}")[2] if stack else ""
+                        if name == "loc":
+                            loc = (elem.text or "").strip()
+                            if loc and parent == "sitemap":
+                                pending.append(loc)
+                            elif loc and parent == "url":
+                                yield loc
+                        elif name in ("url", "sitemap") and stack:
+                            stack[-1].remove(elem)
+            except ParseError as e:
+                app.logger.debug("Sitemap %s is not valid XML: %s", location, e)
+            except zlib.error as e:
+                app.logger.debug("Sitemap %s could not be decompressed: %s", location, e)
+
+
+class _HttpCache:
+    """On-disk store of fetched pages keyed by URL, for conditional re-crawls.
+
+    Only responses carrying an ETag or Last-Modified are kept, since those are
+    the ones a server can answer with 304. Entries expire ``ttl`` seconds after
+    they were last stored or revalidated, and the least recently used entries
+    are evicted once the bodies exceed ``max_bytes``. Each entry can also hold
+    the page's extraction result so a 304 skips parsing as well.
+    """
+
+    def __init__(self, path: str, max_bytes: int, ttl: float):
+        self.path = path
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+              url TEXT PRIMARY KEY,
+              etag TEXT,
+              last_modified TEXT,
+              encoding TEXT,
+              body BLOB NOT NULL,
+              size INTEGER NOT NULL,
+              expires_at REAL NOT NULL,
+              accessed_at REAL NOT NULL,
+              extract_key TEXT,
+              extract TEXT
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_accessed_at ON pages (accessed_at)")
+
+    def validators(self, url: str) -> dict[str, str]:
+        """Conditional request headers for a live cached copy of ``url``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM pages WHERE url = ? AND expires_at > ?",
+                (url, datetime.now().timestamp()),
+            ).fetchone()
+            if row is None:
+                return {}
+            self._stats["conditional"] += 1
+        headers = {}
+        if row[0]:
+            headers["If-None-Match"] = row[0]
+        if row[1]:
+            headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def revalidated(self, url: str) -> str | None:
+        """Return the cached body after a 304 and extend the entry's lifetime."""
+        now = datetime.now().timestamp()
+        with self._lock:
+            row = self._conn.execute("SELECT body, encoding FROM pages WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                self._stats["stale"] += 1
+                return None
+            self._conn.execute(
+                "UPDATE pages SET expires_at = ?, accessed_at = ? WHERE url = ?",
+                (now + self.ttl, now, url),
+            )
+            self._stats["hits"] += 1
+            self._stats["bytes_saved"] += len(row[0])
+        return str(zlib.decompress(row[0]), row[1] or "utf-8", errors="replace")
+
+    def store(self, url: str, resp: requests.Response, content: bytes, encoding: str) -> bool:
+        """Keep a 200 response for conditional re-fetches; False when it cannot be revalidated or is too big."""
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not (etag or last_modified) or "no-store" in resp.headers.get("Cache-Control", "").lower():
+            return False
+        body = zlib.compress(content)
+        if len(body) > self.max_bytes:
+            return False
+        now = datetime.now().timestamp()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, etag, last_modified, encoding, body, size, expires_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, encoding, body, len(body), now + self.ttl, now),
+            )
+            self._stats["stored"] += 1
+            self._evict()
+        return True
+
+    def get_extract(self, url: str, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT extract FROM pages WHERE url = ? AND extract_key = ?", (url, key)
+            ).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def put_extract(self, url: str, key: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET extract_key = ?, extract = ? WHERE url = ?",
+                (key, json.dumps(data, ensure_ascii=False), url),
+            )
+
+    def _evict(self) -> None:
+        now = datetime.now().timestamp()
+        self._conn.execute("DELETE FROM pages WHERE expires_at <= ?", (now,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Trim to 90% so eviction does not run again on the very next store.
+        excess = total - int(self.max_bytes * 0.9)
+        doomed = []
+        for url, size in self._conn.execute("SELECT url, size FROM pages ORDER BY accessed_at"):
+            if excess <= 0:
+                break
+            doomed.append((url,))
+            excess -= size
+        self._conn.executemany("DELETE FROM pages WHERE url = ?", doomed)
+        self._stats["evicted"] += len(doomed)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_http_cache: _HttpCache | None = None
+_http_cache_lock = threading.Lock()
+_http_cache_failed = False
+
+
+def _get_http_cache() -> _HttpCache | None:
+    """Return the shared page cache, or None when it is disabled or cannot be opened."""
+    global _http_cache, _http_cache_failed
+    if not CRAWLER_HTTP_CACHE or _http_cache_failed:
+        return None
+    with _http_cache_lock:
+        if _http_cache is None:
+            try:
+                _http_cache = _HttpCache(
+                    os.path.join(CRAWLER_DATA_DIR, "http_cache.sqlite3"),
+                    CRAWLER_HTTP_CACHE_MB * 1024 * 1024,
+                    CRAWLER_HTTP_CACHE_TTL_DAYS * 86400,
+                )
+            except (OSError, sqlite3.Error) as exc:
+                app.logger.warning("HTTP cache disabled: %s", exc)
+                _http_cache_failed = True
+                return None
+        return _http_cache
+
+
+class _CrawlCheckpoint:
+    """SQLite snapshot of one crawl's frontier, visited set and per-URL contacts, for resuming it.
+
+    ``save`` rewrites the frontier and appends what was recorded since the last
+    save in a single transaction, so a crash leaves the previous checkpoint intact.
+    Pages still in flight are saved back into the frontier, not as visited.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._pending_visited: list[str] = []
+        self._pending_rows: list[dict[str, str]] = []
+        self._pending_seen: list[tuple[str, str]] = []
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE IF NOT EXISTS frontier (
+                  position INTEGER PRIMARY KEY,
+                  url TEXT NOT NULL,
+                  tier INTEGER NOT NULL,
+                  anchor TEXT NOT NULL DEFAULT ''
+                );
+                CREATE TABLE IF NOT EXISTS visited (key TEXT PRIMARY KEY);
+                CREATE TABLE IF NOT EXISTS contacts (
+                  id INTEGER PRIMARY KEY AUTOINCREMENT,
+                  url TEXT NOT NULL,
+                  business_name TEXT,
+                  email TEXT,
+                  phone TEXT
+                );
+                CREATE TABLE IF NOT EXISTS seen (kind TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (kind, value));
+                """
+            )
+            # Checkpoints written before link anchor texts were kept.
+            if "anchor" not in {row[1] for row in conn.execute("PRAGMA table_info(frontier)")}:
+                conn.execute("ALTER TABLE frontier ADD COLUMN anchor TEXT NOT NULL DEFAULT ''")
+            self._conn = conn
+        return self._conn
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The checkpoint database, where large crawls also keep their queue and visited keys."""
+        return self._connect()
+
+    def load(self, include_state: bool = True) -> dict[str, Any] | None:
+        """Return the saved counters and state, or None when there is no checkpoint yet.
+
+        Without ``include_state`` the frontier, visited keys and seen sets are not
+        read into memory; a large crawl uses them from the database instead.
+        """
+        if not self.exists():
+            return None
+        conn = self._connect()
+        counters = conn.execute("SELECT value FROM meta WHERE key = 'counters'").fetchone()
+        if counters is None:
+            return None
+        contact_yield = conn.execute("SELECT value FROM meta WHERE key = 'contact_yield'").fetchone()
+        state = {
+            "counters": json.loads(counters[0]),
+            "contact_yield": {
+                pattern: tuple(counts) for pattern, counts in json.loads(contact_yield[0] if contact_yield else "{}").items()
+            },
+        }
+        if include_state:
+            seen: dict[str, set[str]] = defaultdict(set)
+            for kind, value in conn.execute("SELECT kind, value FROM seen"):
+                seen[kind].add(value)
+            state["frontier"] = conn.execute("SELECT url, tier, anchor FROM frontier ORDER BY position").fetchall()
+            state["visited"] = {key for (key,) in conn.execute("SELECT key FROM visited")}
+            state["seen"] = seen
+        return state
+
+    def iter_rows(self) -> Iterable[dict[str, str]]:
+        """Saved contact rows in the order they were found."""
+        cursor = self._connect().execute("SELECT url, business_name, email, phone FROM contacts ORDER BY id")
+        for url, name, email, phone in cursor:
+            yield {"url": url, "business_name": name or "", "email": email or "", "phone": phone or ""}
+
+    def add_visited(self, key: str) -> None:
+        self._pending_visited.append(key)
+
+    def add_row(self, row: dict[str, str]) -> None:
+        self._pending_rows.append(row)
+
+    def add_seen(self, kind: str, values: Iterable[str]) -> None:
+        self._pending_seen.extend((kind, value) for value in values)
+
+    def save(
+        self,
+        frontier_entries: list[tuple[str, int, str]] | None,
+        counters: dict[str, int],
+        contact_yield: dict[str, tuple[int, int]] | None = None,
+    ) -> None:
+        """Commit the state; ``frontier_entries`` is None when the frontier lives in this database."""
+        conn = self._connect()
+        with conn:
+            if frontier_entries is not None:
+                conn.execute("DELETE FROM frontier")
+                conn.executemany(
+                    "INSERT INTO frontier (position, url, tier, anchor) VALUES (?, ?, ?, ?)",
+                    [(position, url, tier, anchor) for position, (url, tier, anchor) in enumerate(frontier_entries)],
+                )
+            conn.executemany("INSERT OR IGNORE INTO visited (key) VALUES (?)", [(key,) for key in self._pending_visited])
+            conn.executemany(
+                "INSERT INTO contacts (url, business_name, email, phone) VALUES (?, ?, ?, ?)",
+                [(row["url"], row["business_name"], row["email"], row["phone"]) for row in self._pending_rows],
+            )
+            conn.executemany("INSERT OR IGNORE INTO seen (kind, value) VALUES (?, ?)", self._pending_seen)
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('counters', ?)", (json.dumps(counters),)
+            )
+            if contact_yield is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('contact_yield', ?)", (json.dumps(contact_yield),)
+                )
+        self._pending_visited.clear()
+        self._pending_rows.clear()
+        self._pending_seen.clear()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def remove(self) -> None:
+        self.close()
+        for suffix in ("", "-journal"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass
+
+
+class _BloomFilter:
+    """Fixed-size Bloom filter over strings, sized for ``capacity`` items at ``error_rate`` false positives."""
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_FALSE_POSITIVE_RATE):
+        capacity = max(1, int(capacity))
+        self._bit_count = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self._bits = bytearray((self._bit_count + 7) // 8)
+        self._hash_count = max(1, round(self._bit_count / capacity * math.log(2)))
+
+    def _positions(self, value: str) -> Iterable[int]:
+        # Double hashing: k positions from the two halves of one digest.
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * step) % self._bit_count for i in range(self._hash_count))
+
+    def add(self, value: str) -> None:
+        for position in self._positions(value):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class _DiskSet:
+    """Set of strings stored as one ``kind`` of a ``seen`` table, as used by checkpoints."""
+
+    def __init__(self, conn: sqlite3.Connection, kind: str):
+        self.kind = kind
+        self._conn = conn
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen (kind TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (kind, value))"
+        )
+        self._size = conn.execute("SELECT COUNT(*) FROM seen WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, value: str) -> bool:
+        row = self._conn.execute("SELECT 1 FROM seen WHERE kind = ? AND value = ?", (self.kind, value)).fetchone()
+        return row is not None
+
+    def add(self, value: str) -> None:
+        cursor = self._conn.execute("INSERT OR IGNORE INTO seen (kind, value) VALUES (?, ?)", (self.kind, value))
+        self._size += cursor.rowcount
+
+    def update(self, values: Iterable[str]) -> None:
+        for value in values:
+            self.add(value)
+
+
+class _VisitedSet:
+    """Visited URL keys of a large crawl: a Bloom filter in memory, confirmed in the checkpoint database.
+
+    It starts from the keys of pages finished at the last checkpoint save, so
+    pages that were in flight then are crawled again on resume.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, capacity: int):
+        self._conn = conn
+        self._bloom = _BloomFilter(capacity)
+        self.false_positives = 0
+        conn.execute("CREATE TABLE IF NOT EXISTS crawl_keys (key TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM crawl_keys")
+        conn.execute("INSERT OR IGNORE INTO crawl_keys (key) SELECT key FROM visited")
+        self._size = 0
+        for (key,) in conn.execute("SELECT key FROM crawl_keys"):
+            self._bloom.add(key)
+            self._size += 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: str) -> bool:
+        if key not in self._bloom:
+            return False
+        if self._conn.execute("SELECT 1 FROM crawl_keys WHERE key = ?", (key,)).fetchone() is not None:
+            return True
+        self.false_positives += 1
+        return False
+
+    def add(self, key: str) -> None:
+        self._bloom.add(key)
+        self._size += self._conn.execute("INSERT OR IGNORE INTO crawl_keys (key) VALUES (?)", (key,)).rowcount
+
+
+class _DiskFrontier(_CrawlFrontier):
+    """``_CrawlFrontier`` kept in a ``queue`` table of the checkpoint database, for large crawls.
+
+    Only the head of each URL pattern's queue is held in memory. Queue changes
+    are committed by the checkpoint's next ``save``, so a resumed crawl finds the
+    queue as it was at that save.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        key: Callable[[str], str] | None = None,
+        scorer: "_ContactYieldScorer | None" = None,
+    ):
+        super().__init__(key, scorer)
+        self._conn = conn
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS queue (
+              key TEXT PRIMARY KEY,
+              url TEXT NOT NULL,
+              tier INTEGER NOT NULL,
+              anchor TEXT NOT NULL,
+              pattern TEXT NOT NULL,
+              rank REAL NOT NULL,
+              seq INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS queue_order ON queue (pattern, rank, seq)")
+        for tier, count in conn.execute("SELECT tier, COUNT(*) FROM queue GROUP BY tier"):
+            self._sizes[tier] = count
+        self._seq = conn.execute("SELECT COALESCE(MAX(ABS(seq)), 0) FROM queue").fetchone()[0]
+        # Per URL pattern, its best (rank, seq, url, tier, anchor, key) row.
+        self._heads: dict[str, tuple[float, int, str, int, str, str]] = {}
+        for (pattern,) in conn.execute("SELECT DISTINCT pattern FROM queue").fetchall():
+            self._load_head(pattern)
+
+    def __len__(self) -> int:
+        return sum(self._sizes)
+
+    def __contains__(self, url: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM queue WHERE key = ?", (self._key(url),)).fetchone() is not None
+
+    def _load_head(self, pattern: str) -> None:
+        row = self._conn.execute(
+            "SELECT rank, seq, url, tier, anchor, key FROM queue WHERE pattern = ? ORDER BY rank, seq LIMIT 1",
+            (pattern,),
+        ).fetchone()
+        if row is None:
+            self._heads.pop(pattern, None)
+        else:
+            self._heads[pattern] = row
+            self._queue_pattern(pattern)
+
+    def _insert(self, url: str, tier: int, anchor: str, lifo: bool) -> bool:
+        self._seq += 1
+        pattern, score = self._entry_score(url, tier, anchor)
+        entry = (-score, -self._seq if lifo else self._seq, url, tier, anchor, self._key(url))
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO queue (rank, seq, url, tier, anchor, key, pattern) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (*entry, pattern),
+        )
+        if not cursor.rowcount:
+            return False
+        self._sizes[tier] += 1
+        head = self._heads.get(pattern)
+        if head is None or entry[:2] < head[:2]:
+            self._heads[pattern] = entry
+            self._queue_pattern(pattern)
+        return True
+
+    def push(self, url: str, tier: int = _CrawlFrontier.NORMAL, anchor: str = "") -> bool:
+        if not self._insert(url, tier, anchor, lifo=tier == self.DETAIL):
+            self.duplicates += 1
+            return False
+        self.pushed += 1
+        return True
+
+    def pop(self) -> str:
+        pattern = self._next_pattern()
+        _, _, url, tier, _, key = self._heads[pattern]
+        self._conn.execute("DELETE FROM queue WHERE key = ?", (key,))
+        self._sizes[tier] -= 1
+        self._load_head(pattern)
+        return url
+
+    def entries(self) -> list[tuple[str, int, str]]:
+        rows = self._conn.execute("SELECT rank, seq, url, tier, anchor, pattern FROM queue")
+        ranked = sorted(
+            (self._rank(pattern, (rank, seq)), url, tier, anchor) for rank, seq, url, tier, anchor, pattern in rows
+        )
+        return [(url, tier, anchor) for _, url, tier, anchor in ranked]
+
+    def restore(self, entries: Iterable[tuple[str, int, str]]) -> None:
+        for url, tier, anchor in entries:
+            self._insert(url, tier, anchor, lifo=False)
+
+    def restore_first(self, entries: list[tuple[str, int, str]]) -> None:
+        """Queue ``entries`` ahead of equal-scored entries already queued, as ``restore`` of a rebuilt frontier would."""
+        lowest = self._conn.execute("SELECT COALESCE(MIN(seq), 0) FROM queue").fetchone()[0]
+        seq = self._seq
+        for offset, (url, tier, anchor) in enumerate(entries):
+            # _insert takes the next sequence number, so entry i gets ``lowest - len(entries) + i``.
+            self._seq = len(entries) - lowest - offset - 1
+            self._insert(url, tier, anchor, lifo=True)
+        self._seq = max(seq, len(entries) - lowest)
+
+    def _head(self, pattern: str) -> tuple | None:
+        return self._heads.get(pattern)
+
+    def _patterns(self) -> Iterable[str]:
+        return self._heads
+
+    def _pattern_count(self) -> int:
+        return len(self._heads)
+
+
+def _render_path_pattern(path: str) -> str:
+    """URL shape used by the render memory: the first path segment, then ``*`` per deeper segment.
+
+    ``/firmen/wien/cat2/firma-18`` becomes ``/firmen/*/*/*`` and ``/firma-12_X012``
+    becomes ``/*``; a first segment with digits is itself replaced by ``*``.
+    """
+    segments = [segment for segment in path.split("/") if segment]
+    if not segments:
+        return "/"
+    head = "*" if len(segments) == 1 or any(ch.isdigit() for ch in segments[0]) else segments[0].lower()
+    return "/" + "/".join([head] + ["*"] * (len(segments) - 1))
+
+
+class _RenderMemory:
+    """Persistent record, per domain and URL pattern, of whether Playwright rendering found extra contacts.
+
+    After ``min_samples`` renders of a pattern, ``decide`` returns ``"skip"``
+    when none of them helped and ``"render"`` when all of them did; otherwise
+    ``"try"`` (fetch plainly, render when that found no email). Records older
+    than ``ttl`` seconds are relearned.
+    """
+
+    def __init__(self, path: str, min_samples: int, ttl: float):
+        self.min_samples = max(1, int(min_samples))
+        self.ttl = float(ttl)
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS render_outcomes (
+              domain TEXT NOT NULL,
+              pattern TEXT NOT NULL,
+              renders INTEGER NOT NULL DEFAULT 0,
+              helped INTEGER NOT NULL DEFAULT 0,
+              updated_at REAL NOT NULL,
+              PRIMARY KEY (domain, pattern)
+            )
+            """
+        )
+
+    def decide(self, domain: str, pattern: str) -> str:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT renders, helped FROM render_outcomes WHERE domain = ? AND pattern = ? AND updated_at > ?",
+                (domain, pattern, datetime.now().timestamp() - self.ttl),
+            ).fetchone()
+        renders, helped = row or (0, 0)
+        if renders < self.min_samples:
+            decision = "try"
+        elif helped == 0:
+            decision = "skip"
+        elif helped == renders:
+            decision = "render"
+        else:
+            decision = "try"
+        return decision
+
+    def count(self, event: str) -> None:
+        with self._lock:
+            self._stats[event] += 1
+
+    def record(self, domain: str, pattern: str, helped: bool) -> None:
+        now = datetime.now().timestamp()
+        with self._lock:
+            # An expired record starts over instead of being extended.
+            self._conn.execute(
+                "INSERT INTO render_outcomes (domain, pattern, renders, helped, updated_at) VALUES (?, ?, 1, ?, ?)"
+                " ON CONFLICT (domain, pattern) DO UPDATE SET"
+                " renders = CASE WHEN updated_at > ? THEN renders + 1 ELSE 1 END,"
+                " helped = CASE WHEN updated_at > ? THEN helped + excluded.helped ELSE excluded.helped END,"
+                " updated_at = excluded.updated_at",
+                (domain, pattern, int(helped), now, now - self.ttl, now - self.ttl),
+            )
+            self._stats["renders"] += 1
+            self._stats["helped"] += int(helped)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+
+_render_memory: _RenderMemory | None = None
+_render_memory_lock = threading.Lock()
+_render_memory_failed = False
+
+
+def _get_render_memory() -> _RenderMemory | None:
+    """Return the shared render memory, or None when it is disabled or cannot be opened."""
+    global _render_memory, _render_memory_failed
+    if not CRAWLER_RENDER_MEMORY or _render_memory_failed:
+        return None
+    with _render_memory_lock:
+        if _render_memory is None:
+            try:
+                _render_memory = _RenderMemory(
+                    os.path.join(CRAWLER_DATA_DIR, "render_memory.sqlite3"),
+                    CRAWLER_RENDER_MIN_SAMPLES,
+                    CRAWLER_RENDER_MEMORY_DAYS * 86400,
+                )
+            except (OSError, sqlite3.Error) as exc:
+                app.logger.warning("Render memory disabled: %s", exc)
+                _render_memory_failed = True
+                return None
+        return _render_memory
+
+
+class _BrowserPool:
+    """Warm headless Chromium instances shared by every crawl in this process.
+
+    Playwright's sync API is bound to the thread that started it, so each browser
+    lives on its own worker thread and render jobs are handed over through a queue.
+    Browsers are relaunched after ``max_pages`` renders or when they crash.
+
+    The ``light`` profile aborts image, media and font requests and requests to
+    known tracker and consent hosts, and stops waiting at ``domcontentloaded``
+    plus up to ``settle_ms`` for a contact link. ``full`` waits for network idle.
+    """
+
+    def __init__(self, size: int, max_pages: int, profile: str = "light", settle_ms: int = 1500):
+        self.size = max(1, int(size))
+        self.max_pages = max(1, int(max_pages))
+        self.light = profile != "full"
+        self.settle_ms = max(0, int(settle_ms))
+        self._stats: Counter = Counter()
+        self._jobs: Queue = Queue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._unavailable = False
+
+    def _ensure_workers(self) -> None:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("browser pool has been shut down")
+            self._threads = [t for t in self._threads if t.is_alive()]
+            while len(self._threads) < self.size:
+                worker = threading.Thread(
+                    target=self._run_worker,
+                    name=f"crawl-browser-{len(self._threads)}",
+                    daemon=True,
+                )
+                worker.start()
+                self._threads.append(worker)
+
+    def render(self, url: str, timeout: int) -> str | None:
+        if self._unavailable:
+            return None
+        try:
+            self._ensure_workers()
+        except RuntimeError:
+            return None
+        future: Future = Future()
+        self._jobs.put((url, timeout, future))
+        # Generous outer bound in case a browser hangs outside Playwright's own timeouts.
+        deadline = (timeout / 1000) + 60
+        waited = 0.0
+        while waited < deadline:
+            try:
+                return future.result(timeout=1.0)
+            except FutureTimeoutError:
+                waited += 1.0
+                if self._unavailable:
+                    break
+        future.cancel()
+        app.logger.warning("Playwright render timed out for %s", url)
+        return None
+
+    def shutdown(self, wait: float = 10.0) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._jobs.put(None)
+        for worker in threads:
+            worker.join(timeout=wait)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, **counts: int) -> None:
+        with self._lock:
+            self._stats.update(counts)
+
+    def _route(self, route) -> None:
+        request = route.request
+        host = (urlparse(request.url).hostname or "").lower()
+        if request.resource_type in RENDER_BLOCKED_RESOURCE_TYPES or any(
+            host == blocked or host.endswith("." + blocked) for blocked in RENDER_BLOCKED_HOSTS
+        ):
+            self._count(blocked=1)
+            route.abort()
+        else:
+            route.continue_()
+
+    def _load(self, page, url: str, timeout: int) -> None:
+        if not self.light:
+            page.goto(url, wait_until="networkidle", timeout=timeout)
+            return
+        page.goto(url, wait_until="domcontentloaded", timeout=timeout)
+        if self.settle_ms:
+            try:
+                page.wait_for_selector(RENDER_READY_SELECTOR, state="attached", timeout=self.settle_ms)
+            except Exception:
+                # No contact link appeared within the budget; take the DOM as it is.
+                self._count(settle_timeouts=1)
+
+    @staticmethod
+    def _close_quietly(*resources) -> None:
+        for resource in resources:
+            if resource is None:
+                continue
+            try:
+                resource.close()
+            except Exception:
+                pass
+
+    def _run_worker(self) -> None:
+        try:
+            from playwright.sync_api import sync_playwright
+
+            playwright = sync_playwright().start()
+        except Exception as e:
+            app.logger.warning("Playwright could not be started: %s", e)
+            self._unavailable = True
+            return
+        try:
+            self._serve(playwright)
+        finally:
+            try:
+                playwright.stop()
+            except Exception:
+                pass
+
+    def _serve(self, playwright) -> None:
+        browser = context = None
+        served = 0
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+            url, timeout, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            content = None
+            for attempt in range(2):
+                try:
+                    if browser is None or not browser.is_connected() or served >= self.max_pages:
+                        self._close_quietly(context, browser)
+                        browser = playwright.chromium.launch(headless=True, args=["--no-sandbox"])
+                        context = browser.new_context(user_agent=CRAWLER_USER_AGENT)
+                        if self.light:
+                            context.route("**/*", self._route)
+                        served = 0
+                    served += 1
+                    page = context.new_page()
+                    started = monotonic()
+                    try:
+                        self._load(page, url, timeout)
+                        content = page.content()
+                    finally:
+                        self._close_quietly(page)
+                    self._count(renders=1, render_ms=int((monotonic() - started) * 1000))
+                    break
+                except Exception as e:
+                    if attempt == 0 and (browser is None or not browser.is_connected()):
+                        app.logger.warning("Playwright browser crashed on %s, relaunching: %s", url, e)
+                        self._close_quietly(context, browser)
+                        browser = context = None
+                        continue
+                    app.logger.warning("Playwright fetch failed for %s: %s", url, e)
+                    break
+            future.set_result(content)
+        self._close_quietly(context, browser)
+
+
+_browser_pool: _BrowserPool | None = None
+_browser_pool_lock = threading.Lock()
+
+
+def _get_browser_pool() -> _BrowserPool:
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = _BrowserPool(
+                CRAWLER_BROWSER_POOL_SIZE, CRAWLER_BROWSER_MAX_PAGES, CRAWLER_RENDER_PROFILE, CRAWLER_RENDER_SETTLE_MS
+            )
+            atexit.register(_browser_pool.shutdown)
+        return _browser_pool
+
+
+class _ExtractionPool:
+    """Worker processes running ``_extract_page``, so parsing is not serialized by the GIL.
+
+    Pages are sent in chunks of up to ``chunk_size`` to spread the pickling
+    overhead; a partial chunk goes out when no further page arrives within
+    ``EXTRACT_CHUNK_WAIT``. Once the pool breaks (a worker died), pages are
+    extracted in the calling thread instead.
+    """
+
+    def __init__(self, workers: int, chunk_size: int):
+        # Workers are spawned rather than forked: the crawler process is full of threads and locks.
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        self.chunk_size = max(1, int(chunk_size))
+        self.broken = False
+        self._queue: Queue = Queue()
+        self._stats: Counter = Counter()
+        self._lock = threading.Lock()
+        threading.Thread(target=self._dispatch, name="extract-dispatch", daemon=True).start()
+
+    def extract(self, *args) -> dict[str, Any]:
+        """``_extract_page(*args)`` in a worker process, or here when the pool is broken."""
+        if not self.broken:
+            future: Future = Future()
+            self._queue.put((args, future))
+            try:
+                return future.result()
+            except BrokenProcessPool as exc:
+                if not self.broken:
+                    self.broken = True
+                    app.logger.warning("Extraction workers failed, parsing in-process from now on: %s", exc)
+        with self._lock:
+            self._stats["in_process"] += 1
+        return _extract_page(*args)
+
+    def _dispatch(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = monotonic() + EXTRACT_CHUNK_WAIT
+            while len(batch) < self.chunk_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - monotonic())))
+                except Empty:
+                    break
+            with self._lock:
+                self._stats["chunks"] += 1
+                self._stats["pages"] += len(batch)
+            try:
+                chunk = self._executor.submit(_extract_pages, [args for args, _ in batch])
+            except (BrokenProcessPool, RuntimeError) as exc:
+                for _, future in batch:
+                    future.set_exception(BrokenProcessPool(str(exc)))
+                continue
+            chunk.add_done_callback(lambda done, batch=batch: self._resolve(done, batch))
+
+    @staticmethod
+    def _resolve(chunk: Future, batch: list[tuple[tuple, Future]]) -> None:
+        try:
+            results = chunk.result()
+        except Exception as exc:
+            # A crashed worker or an unpicklable page; callers retry in-process.
+            for _, future in batch:
+                future.set_exception(BrokenProcessPool(str(exc) or exc.__class__.__name__))
+            return
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_extraction_pool: _ExtractionPool | None = None
+_extraction_pool_lock = threading.Lock()
+_extraction_pool_failed = False
+
+
+def _get_extraction_pool() -> _ExtractionPool | None:
+    """Return the shared extraction pool, or None when it is disabled or cannot start."""
+    global _extraction_pool, _extraction_pool_failed
+    if CRAWLER_EXTRACT_WORKERS <= 0 or _extraction_pool_failed:
+        return None
+    with _extraction_pool_lock:
+        if _extraction_pool is None:
+            try:
+                _extraction_pool = _ExtractionPool(CRAWLER_EXTRACT_WORKERS, CRAWLER_EXTRACT_CHUNK_SIZE)
+            except (OSError, ValueError, NotImplementedError) as exc:
+                app.logger.warning("Extraction workers unavailable, parsing in-process: %s", exc)
+                _extraction_pool_failed = True
+                return None
+            atexit.register(_extraction_pool.shutdown)
+        return _extraction_pool
+
+
+def fetch_with_playwright(url: str, timeout: int = 15000) -> str | None:
+    """Render page with the shared Playwright browser pool and return HTML, or None on error."""
+    try:
+        import playwright.sync_api  # noqa: F401
+    except Exception as e:
+        app.logger.debug("Playwright not available: %s", e)
+        return None
+
+    return _get_browser_pool().render(url, timeout)
+
+
+_fetch_stats: Counter = Counter()
+_fetch_stats_lock = threading.Lock()
+
+
+def fetch_stats() -> dict[str, int]:
+    """Process-wide counters of page bodies skipped or cut off by ``_read_page_body``."""
+    with _fetch_stats_lock:
+        return dict(_fetch_stats)
+
+
+def _count_fetch(stats: Counter | None = None, **counts: int) -> None:
+    """Add to the process-wide ``fetch_stats`` and, when given, to a crawl's own ``stats``."""
+    with _fetch_stats_lock:
+        _fetch_stats.update(counts)
+    if stats is not None:
+        stats.update(counts)
+
+
+_META_CHARSET_REGEX = re.compile(rb"""<meta[^>]+?charset\s*=\s*["']?\s*([a-z0-9_.:-]+)""", re.IGNORECASE)
+_BYTE_ORDER_MARKS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+# Browsers decode these labels as windows-1252 (WHATWG Encoding), which also maps 0x80-0x9f (€, „, “).
+_WINDOWS_1252_ALIASES = frozenset({"latin-1", "iso8859-1", "ascii"})
+
+
+def _lookup_charset(label: str | None) -> str | None:
+    """Python codec name for a charset label, or None when the label is unknown."""
+    if not label:
+        return None
+    try:
+        name = codecs.lookup(label.strip().strip("\"'")).name
+    except LookupError:
+        return None
+    return "cp1252" if name in _WINDOWS_1252_ALIASES else name
+
+
+def _content_type_charset(content_type: str) -> str | None:
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return _lookup_charset(value)
+    return None
+
+
+def _decode_body(content: bytes, content_type: str = "", stats: Counter | None = None) -> tuple[str, str]:
+    """Decode a page body and return ``(text, encoding)``.
+
+    Tries, in order: a byte order mark, the Content-Type charset, a ``<meta>``
+    charset in the first ``CHARSET_SNIFF_BYTES``, strict UTF-8, and only then
+    charset detection over the whole body (what ``Response.text`` does whenever
+    the header has no charset). A character cut in half at the end of the body
+    (a body truncated at the size cap) is dropped rather than failing the UTF-8
+    check. Counts and timings go to ``fetch_stats`` and ``stats``.
+    """
+    started = perf_counter()
+    method, encoding, text = "bom", None, None
+    for mark, name in _BYTE_ORDER_MARKS:
+        if content.startswith(mark):
+            encoding = name
+            break
+    if encoding is None:
+        method, encoding = "header", _content_type_charset(content_type)
+    if encoding is None:
+        match = _META_CHARSET_REGEX.search(content, 0, CHARSET_SNIFF_BYTES)
+        method, encoding = "meta", _lookup_charset(match.group(1).decode("ascii")) if match else None
+        if encoding and encoding.startswith("utf-16"):
+            encoding = "utf-8"  # a document that could be read this far is ASCII-compatible
+    if encoding is None:
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError as exc:
+            if exc.reason == "unexpected end of data" and exc.end == len(content):
+                # Only the last character is incomplete; everything before it decoded.
+                text = content.decode("utf-8", errors="ignore")
+        if text is not None:
+            method, encoding = "utf8", "utf-8"
+        else:
+            detected = requests.compat.chardet.detect(content)["encoding"]
+            method, encoding = "detected", _lookup_charset(detected) or "cp1252"
+    if text is None:
+        text = str(content, encoding, errors="replace")
+    _count_fetch(stats, **{f"decoded_{method}": 1, f"decode_us_{method}": int((perf_counter() - started) * 1_000_000)})
+    return text, encoding
+
+
+def _read_page_body(url: str, resp: requests.Response, stats: Counter | None = None) -> bytes | None:
+    """Read a streamed response up to ``CRAWLER_MAX_PAGE_KB``; None when it is not worth reading.
+
+    Non-HTML content types and unencoded bodies whose Content-Length exceeds the
+    cap are rejected from the headers alone. The cap applies to decoded bytes, so
+    a compressed body, or one without a usable Content-Length, is read until the
+    cap and cut off there.
+    """
+    max_bytes = CRAWLER_MAX_PAGE_KB * 1024
+    try:
+        declared = int(resp.headers.get("Content-Length") or -1)
+    except ValueError:
+        declared = -1
+    content_type = resp.headers.get("Content-Type", "").split(";")[0].strip().lower()
+    if content_type and content_type not in HTML_CONTENT_TYPES:
+        app.logger.debug("Skipping %s: content type %s", url, content_type)
+        _count_fetch(stats, skipped_content_type=1, bytes_saved=max(declared, 0))
+        resp.close()
+        return None
+    # With a Content-Encoding the length is that of the compressed body, which says little about the page.
+    content_encoding = resp.headers.get("Content-Encoding", "").strip().lower()
+    if declared > max_bytes and content_encoding in ("", "identity"):
+        app.logger.debug("Skipping %s: %d bytes exceeds the page size cap", url, declared)
+        _count_fetch(stats, skipped_too_large=1, bytes_saved=declared)
+        resp.close()
+        return None
+    body = bytearray()
+    for chunk in resp.iter_content(FETCH_CHUNK_BYTES):
+        body += chunk
+        if len(body) >= max_bytes:
+            app.logger.debug("Truncating %s at %d bytes", url, max_bytes)
+            del body[max_bytes:]
+            _count_fetch(stats, truncated=1)
+            resp.close()
+            break
+    _count_fetch(stats, bytes_read=len(body))
+    return bytes(body)
+
+
+def _fetch_page(
+    url: str, timeout: int = 10, politeness: _PolitenessScheduler | None = None, stats: Counter | None = None
+) -> tuple[str, int, bool, int]:
+    """GET ``url`` through the page cache. Returns (html, status, not_modified, size).
+
+    ``not_modified`` is True when the server answered 304 and the cached body was used.
+    ``size`` is the number of body bytes read, before decoding (0 for a 304).
+    Response statuses are reported to ``politeness`` so it can adapt the host's rate.
+    The body is streamed and gated by ``_read_page_body``; a skipped body comes back
+    as an empty string with the response's status. Body and page cache counts are
+    added to ``stats`` as well as to the process-wide totals.
+    """
+    if stats is None:
+        stats = Counter()
+    cache = _get_http_cache()
+    headers = cache.validators(url) if cache is not None else {}
+    if headers:
+        stats["cache_conditional"] += 1
+    try:
+        resp = _get_http_session().get(url, timeout=timeout, headers=headers, stream=True)
+        if politeness is not None:
+            politeness.record(url, resp.status_code, resp.headers.get("Retry-After"))
+        if resp.status_code == 304 and headers:
+            resp.close()
+            cached = cache.revalidated(url)
+            if cached is not None:
+                stats["cache_hits"] += 1
+                return cached, 200, True, 0
+            # Entry vanished between lookup and reply (evicted); fetch it in full, paced like any request.
+            if politeness is not None:
+                politeness.wait(url)
+            resp = _get_http_session().get(url, timeout=timeout, stream=True)
+            if politeness is not None:
+                politeness.record(url, resp.status_code, resp.headers.get("Retry-After"))
+        with resp:
+            content = _read_page_body(url, resp, stats)
+        if content is None:
+            return "", resp.status_code, False, 0
+        # A body cut off at the size cap is incomplete, so it is never cached.
+        text, encoding = _decode_body(content, resp.headers.get("Content-Type", ""), stats)
+        if cache is not None and resp.status_code == 200 and len(content) < CRAWLER_MAX_PAGE_KB * 1024:
+            if cache.store(url, resp, content, encoding):
+                stats["cache_stored"] += 1
+        return text, resp.status_code, False, len(content)
+    except Exception as e:
+        app.logger.warning("requests.get failed for %s: %s", url, e)
+        return "", 0, False, 0
+
+
+def fetch_html(url: str, render_js: bool = False, timeout: int = 10):
+    """Fetch HTML via the shared session or Playwright (when render_js=True). Returns (html, status)."""
+    if render_js:
+        html = fetch_with_playwright(url, timeout=(timeout * 1000))
+        if html is not None:
+            return html, 200
+
+    html, status, _, _ = _fetch_page(url, timeout=timeout)
+    return html, status
+
+
+def _is_probable_detail_path(path: str) -> bool:
+    segs = [s for s in path.split("/") if s]
+    if not segs:
+        return False
+    if len(segs) == 1 and "_" in segs[0] and not segs[0].startswith("_assets"):
+        return True
+    if len(segs) > 2 and segs[0] == "firmen":
+        return True
+    return False
+
+
+def _fallback_business_name_from_url(raw_url: str) -> str:
+  netloc = (urlparse(raw_url).netloc or "").lower().strip()
+  if netloc.startswith("www."):
+    netloc = netloc[4:]
+  if any(marker in netloc for marker in ("herold", "yelp", "google", "maps", "tripadvisor", "foursquare", "yellowpages", "gelbeseiten")):
+    return ""
+  if not netloc:
+    return ""
+  host_label = netloc.split(".")[0]
+  if not host_label:
+    return ""
+  cleaned = re.sub(r"[^a-z0-9]+", " ", host_label, flags=re.IGNORECASE).strip()
+  return cleaned.title() if cleaned else ""
+
+
+class _SiteCrawl:
+    """One crawl() run over a site.
+
+    ``fetch_page`` is the per-page work done in fetch threads (fetching,
+    rendering, extraction); ``handle_page`` applies each result in dispatch
+    order, so link expansion, rows and near-duplicate decisions do not depend on
+    thread timing. ``summary`` gathers the stats logged when the run ends.
+    """
+
+    def __init__(
+        self,
+        start_url: str,
+        max_pages: int,
+        render_js: bool,
+        *,
+        concurrency: int | None,
+        per_host_limit: int | None,
+        limiter: _FetchLimiter | None,
+        politeness: _PolitenessScheduler | None,
+        use_sitemaps: bool | None,
+        progress: Callable[[dict[str, Any]], None] | None,
+        cancel_event: threading.Event | None,
+        on_row: Callable[[dict[str, str]], None] | None,
+        keep_rows: bool,
+        checkpoint: _CrawlCheckpoint | None,
+        budget: _CrawlBudget | None,
+        large: bool,
+        deadline: float | None,
+        stall_pages: int | None,
+        max_bytes: int | None,
+        on_stop: Callable[[str], None] | None,
+        scratch: _CrawlCheckpoint | None,
+    ):
+        self.start_url = start_url = canonicalize_url(start_url)
+        self.max_pages = max_pages
+        self.render_js = render_js
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.on_row = on_row
+        self.keep_rows = keep_rows
+        self.checkpoint = checkpoint
+        self.budget = budget
+        self.large = large
+        self.on_stop = on_stop
+        self.scratch = scratch
+        self.stall_pages = CRAWLER_STALL_PAGES if stall_pages is None else stall_pages
+        self.max_bytes = CRAWLER_MAX_CRAWL_MB * 1024 * 1024 if max_bytes is None else max_bytes
+        # Dedup keys (see _url_key) of every page dispatched or known by a rel=canonical alias.
+        self.visited = set()
+        self.rows: list[dict[str, str]] = []
+        self.row_count = 0
+        self.seen_emails = set()
+        self.seen_phones = set()
+
+        self.parsed_start = urlparse(start_url)
+        self.base_domain = _normalize_netloc(self.parsed_start.netloc)
+        self.start_segments = [s for s in self.parsed_start.path.split("/") if s]
+        self.phone_region = _infer_region_from_netloc(self.parsed_start.netloc) or DEFAULT_PHONE_REGION
+        self.yield_memory = _get_contact_yield_memory()
+        self.scorer = None
+        if CRAWLER_CONTACT_PRIORITY:
+            self.scorer = _ContactYieldScorer(
+                self.yield_memory.load(self.base_domain) if self.yield_memory is not None else None
+            )
+        if large:
+            store = checkpoint.connection
+            self.frontier = _DiskFrontier(store, key=_url_key, scorer=self.scorer)
+            self.visited = _VisitedSet(store, max(2 * max_pages, 10000))
+            self.seen_emails, self.seen_phones = _DiskSet(store, "email"), _DiskSet(store, "phone")
+        else:
+            self.frontier = _CrawlFrontier(key=_url_key, scorer=self.scorer)
+        # Seen sets of a large crawl are the checkpoint's own tables.
+        self.save_seen = checkpoint is not None and not large
+        warm_phone_metadata(self.phone_region)
+        # This crawl's own fetch, cache, politeness, render and phone candidate counts; the
+        # module-level stats functions are process-wide totals over all running crawls.
+        self.stats: Counter = Counter()
+
+        if limiter is None:
+            limiter = _FetchLimiter(
+                concurrency or CRAWLER_CONCURRENCY,
+                per_host_limit or CRAWLER_PER_HOST_CONCURRENCY,
+            )
+        self.limiter = limiter
+        _get_http_session(limiter.concurrency)
+        self.politeness = politeness or _get_politeness()
+
+        # The time limit also covers sitemap seeding.
+        if deadline is None and CRAWLER_TIME_LIMIT_MINUTES:
+            deadline = monotonic() + CRAWLER_TIME_LIMIT_MINUTES * 60
+        self.deadline = deadline
+
+        self.in_flight: deque = deque()
+        self.pages_done = 0
+        self.pages_fetched = 0
+        self.dispatched = 0
+        self.canonical_duplicates = 0
+        self.duplicates_skipped = 0
+        self.yielding_pages = 0
+        self.fetched_seeded = 0
+        self.yielding_seeded = 0
+        self.pages_since_contact = 0
+        self.bytes_read = 0
+        self.checkpoint_saves = 0
+        self.stop_reason: str | None = None
+        self.found_emails: set[str] = set()
+        self.found_phones: set[str] = set()
+        if large:
+            self.found_emails = _DiskSet(checkpoint.connection, "found_email")
+            self.found_phones = _DiskSet(checkpoint.connection, "found_phone")
+
+        restored = checkpoint.load(include_state=not large) if checkpoint is not None else None
+        self.seeded_urls = _DiskSet(checkpoint.connection, "seeded") if large else set()
+        if restored is not None:
+            self._restore_state(restored)
+        else:
+            if CRAWLER_SITEMAPS if use_sitemaps is None else use_sitemaps:
+                self._seed_from_sitemaps()
+            # With sitemap seeds queued, the start page still goes first.
+            self.frontier.push(start_url, _CrawlFrontier.DETAIL if self.seeded_urls else _CrawlFrontier.NORMAL)
+
+        self.http_cache = _get_http_cache()
+        self.near_duplicates = None
+        if CRAWLER_SKIP_NEAR_DUPLICATES:
+            self.near_duplicates = _NearDuplicateIndex(
+                CRAWLER_NEAR_DUPLICATE_BITS, window=LARGE_CRAWL_DUPLICATE_WINDOW if large else None
+            )
+        # Cached extraction results are only reused by crawls that would extract the same way.
+        self.extract_cache_key = ":".join(
+            str(part)
+            for part in (
+                CRAWL_EXTRACT_CACHE_VERSION,
+                self.phone_region,
+                self.base_domain,
+                _CRAWL_HTML_PARSER,
+                int(CRAWLER_STRAINED_PARSE),
+            )
+        )
+        self.render_memory = _get_render_memory() if render_js else None
+        self.extraction_pool = _get_extraction_pool()
+        self.extract_page = self.extraction_pool.extract if self.extraction_pool is not None else _extract_page
+
+        if restored is not None:
+            if budget is not None:
+                budget.charge(self.dispatched)
+            for row in checkpoint.iter_rows():
+                self._emit_row(row, save=False)
+        self.last_checkpoint = self.pages_fetched
+
+    def _restore_state(self, restored: dict[str, Any]) -> None:
+        if not self.large:
+            self.visited = restored["visited"]
+            self.frontier.restore(restored["frontier"])
+            self.seen_emails = restored["seen"]["email"]
+            self.seen_phones = restored["seen"]["phone"]
+            self.seeded_urls = restored["seen"]["seeded"]
+            self.found_emails = restored["seen"]["found_email"]
+            self.found_phones = restored["seen"]["found_phone"]
+        if self.scorer is not None:
+            self.scorer.restore(restored["contact_yield"])
+        counters = restored["counters"]
+        self.pages_fetched = counters["pages_fetched"]
+        self.pages_done = counters["pages_done"]
+        self.dispatched = counters["dispatched"]
+        self.canonical_duplicates = counters["canonical_duplicates"]
+        self.duplicates_skipped = counters["duplicates_skipped"]
+        self.yielding_pages = counters["yielding_pages"]
+        self.fetched_seeded = counters["fetched_seeded"]
+        self.yielding_seeded = counters["yielding_seeded"]
+        # Not in checkpoints written before the early-stop conditions.
+        self.pages_since_contact = counters.get("pages_since_contact", 0)
+        self.bytes_read = counters.get("bytes_read", 0)
+        app.logger.info(
+            "Resuming crawl of %s: %d pages done, %d queued", self.start_url, len(self.visited), len(self.frontier)
+        )
+
+    def _seed_from_sitemaps(self) -> None:
+        seed_limit = self.max_pages * 2
+        scope = self.parsed_start.path.rstrip("/")
+        seed_deadline = monotonic() + CRAWLER_SITEMAP_MAX_SECONDS
+        if self.deadline is not None:
+            seed_deadline = min(seed_deadline, self.deadline)
+        sitemap_urls = _iter_sitemap_urls(
+            _sitemap_locations(self.start_url, self.politeness),
+            self.politeness,
+            cancel_event=self.cancel_event,
+            deadline=seed_deadline,
+        )
+        for loc in sitemap_urls:
+            seed = canonicalize_url(loc)
+            parsed_seed = urlparse(seed)
+            if parsed_seed.scheme not in ("http", "https") or _normalize_netloc(parsed_seed.netloc) != self.base_domain:
+                continue
+            if scope and not parsed_seed.path.startswith(scope + "/"):
+                continue
+            if not _is_probable_detail_path(parsed_seed.path) or seed == self.start_url:
+                continue
+            if self.frontier.push(seed, _CrawlFrontier.DETAIL):
+                self.seeded_urls.add(seed)
+                if len(self.seeded_urls) >= seed_limit:
+                    break
+        app.logger.info("Seeded %d detail pages from sitemaps", len(self.seeded_urls))
+        if self.save_seen:
+            self.checkpoint.add_seen("seeded", self.seeded_urls)
+
+    def enqueue(self, u: str, tier: int = _CrawlFrontier.NORMAL, anchor: str = "") -> None:
+        u = canonicalize_url(u)
+        if _url_key(u) in self.visited:
+            return
+        self.frontier.push(u, tier, anchor)
+
+    def page_rows(self, url: str, emails: set[str], phones: set[str], business_name: str) -> list[dict[str, str]]:
+      if not business_name:
+        business_name = _fallback_business_name_from_url(url)
+
+      normalized_phones: list[str] = []
+      for phone in phones:
+        p = normalize_phone(phone, region=self.phone_region)
+        if not p or p in self.seen_phones:
+          continue
+        self.seen_phones.add(p)
+        normalized_phones.append(p)
+
+      new_emails: list[str] = []
+      for email in emails:
+        e = email.lower().strip()
+        if not e or e in self.seen_emails:
+          continue
+        self.seen_emails.add(e)
+        new_emails.append(email)
+
+      if self.save_seen:
+        self.checkpoint.add_seen("phone", normalized_phones)
+        self.checkpoint.add_seen("email", (email.lower().strip() for email in new_emails))
+
+      if new_emails:
+        phone_sample = normalized_phones[0] if normalized_phones else ""
+        return [
+          {"url": url, "business_name": business_name, "email": email, "phone": phone_sample}
+          for email in new_emails
+        ]
+      return [
+        {"url": url, "business_name": business_name, "email": "", "phone": phone}
+        for phone in normalized_phones
+      ]
 
-        html, status = fetch_html(url, render_js=False)
-        app.logger.debug("Fetched %s status=%s len=%d (requests)", url, status, len(html or ""))
+    def _emit_row(self, row: dict[str, str], save: bool = True) -> None:
+        self.row_count += 1
+        if save and self.checkpoint is not None:
+            self.checkpoint.add_row(row)
+        if self.keep_rows:
+            self.rows.append(row)
+        if self.on_row is not None:
+            self.on_row(row)
+
+    def _wait(self, url: str, counts: Counter) -> None:
+        waited = self.politeness.wait(url)
+        if waited:
+            counts["waits"] += 1
+            counts["wait_ms"] += int(waited * 1000)
+
+    def _render(self, url: str, counts: Counter) -> str | None:
+        self._wait(url, counts)
+        with self.limiter.slot(url):
+            started = monotonic()
+            html = fetch_with_playwright(url, timeout=10000)
+            counts["renders"] += 1
+            counts["render_ms"] += int((monotonic() - started) * 1000)
+        return html
+
+    def _extract(self, html: str, url: str, counts: Counter, include_attributes: bool = True) -> dict[str, Any]:
+        extracted = self.extract_page(html, url, self.base_domain, self.phone_region, include_attributes)
+        # Counted here rather than where they were found: extraction may run in a worker process.
+        phone_counts = extracted.pop("phone_candidates", {})
+        _add_phone_candidate_stats(phone_counts)
+        counts.update(phone_counts)
+        counts["extracted"] += 1
+        return extracted
+
+    def fetch_page(self, url: str) -> dict[str, Any]:
+        """Fetch, render and extract one page; runs in a fetch thread and only reads shared crawl state.
+
+        The page's counts come back under ``stats`` for handle_page to add to the crawl's.
+        """
+        counts: Counter = Counter()
+        parsed = urlparse(url)
+        base_domain, phone_region = self.base_domain, self.phone_region
+        render_memory, limiter = self.render_memory, self.limiter
+        detail = _is_probable_detail_path(parsed.path)
+        render_pattern = None
+        render_decision = "try"
+        if render_memory is not None and detail:
+            render_pattern = _render_path_pattern(parsed.path)
+            render_decision = render_memory.decide(base_domain, render_pattern)
+        html = None
+        # Body bytes read from the network; rendered pages are not counted.
+        page_bytes = 0
+        if render_decision == "render":
+            # Rendering has always found more on this URL pattern, so the plain fetch is skipped.
+            html = self._render(url, counts)
+            status, not_modified = 200, False
+            render_memory.count("direct")
+            counts["render_direct"] += 1
+            app.logger.debug("Fetched %s len=%d (playwright, %s needs rendering)", url, len(html or ""), render_pattern)
+        if html is None:
+            for attempt in range(CRAWLER_THROTTLE_RETRIES + 1):
+                # Wait for the host's token before taking a fetch slot, so a throttled host never holds one idle.
+                self._wait(url, counts)
+                with limiter.slot(url):
+                    html, status, not_modified, page_bytes = _fetch_page(url, politeness=self.politeness, stats=counts)
+                if status not in _PolitenessScheduler.THROTTLE_STATUSES:
+                    break
+                counts["throttled"] += 1
+                app.logger.debug("Throttled on %s (%s), attempt %d", url, status, attempt + 1)
+            app.logger.debug(
+                "Fetched %s status=%s len=%d (requests%s)", url, status, len(html or ""), ", 304" if not_modified else ""
+            )
         try:
             status_num = int(status)
         except Exception:
             status_num = 0
         if not (200 <= status_num < 300):
             app.logger.debug("Skipping non-2xx: %s (%s)", url, status)
-            continue
-
-        soup = BeautifulSoup(html or "", "html.parser")
-
-        business_name = extract_business_name_from_soup(soup)
-
-        emails = set(EMAIL_REGEX.findall(html or ""))
-        phones = set()
-
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
-            if href.lower().startswith("tel:"):
-                num = href.split("tel:")[1].split("?")[0].strip()
-                n = normalize_phone(num, region=phone_region)
-                if n:
-                    phones.add(n)
-
-        for tag_name in VISIBLE_TAGS:
-            for tag in soup.find_all(tag_name):
-                text = tag.get_text(" ", strip=True)
-                if not text:
-                    continue
-                if len(text) > 300:
-                    continue
-                for n in find_labelled_phones(text, region=phone_region):
-                    phones.add(n)
-
-        for tag in soup.find_all(attrs=True):
-            if tag.name in {"script", "style", "noscript", "svg"}:
-                continue
-            for attr, val in tag.attrs.items():
-                if isinstance(val, str):
-                    lower_attr = attr.lower()
-                    if lower_attr == "style":
-                        continue
-                    if any(k in lower_attr for k in ("tel", "phone", "kontakt", "mobil", "fax")):
-                        n = normalize_phone(val, region=phone_region)
-                        if n:
-                            phones.add(n)
-                    else:
-                        for n in find_labelled_phones(val, region=phone_region):
-                            phones.add(n)
-                elif isinstance(val, (list, tuple)):
-                    for part in val:
-                        for n in find_labelled_phones(str(part), region=phone_region):
-                            phones.add(n)
-
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
-            if href.lower().startswith("mailto:"):
-                addr = href.split("mailto:")[1].split("?")[0].strip()
-                if EMAIL_REGEX.match(addr):
-                    emails.add(addr)
+            return {"url": url, "status": status_num, "ok": False, "bytes": page_bytes, "stats": counts}
+        if not html:
+            app.logger.debug("Skipping empty or non-HTML body: %s", url)
+            return {"url": url, "status": status_num, "ok": False, "bytes": page_bytes, "stats": counts}
+
+        # Contacts of a detail page that may still be rendered can be missing from this HTML, so
+        # it would look like a duplicate of every other page of the same template.
+        render_possible = self.render_js and detail and render_decision != "skip"
+        fingerprint = None
+        if self.near_duplicates is not None and not render_possible:
+            fingerprint = self.near_duplicates.fingerprint(html)
+            # Only pages handled before this one are in the index, so a match here is final. With a
+            # window it may be forgotten by this page's turn, so handle_page decides alone.
+            original = self.near_duplicates.find(fingerprint) if self.near_duplicates.window is None else None
+            if original is not None:
+                app.logger.debug("Skipping near-duplicate %s of %s", url, original)
+                return {
+                    "url": url,
+                    "status": status_num,
+                    "ok": False,
+                    "bytes": page_bytes,
+                    "duplicate_of": original,
+                    "stats": counts,
+                }
 
-        if not emails and is_probable_detail_path(parsed.path) and render_js:
+        http_cache = self.http_cache
+        cached = http_cache.get_extract(url, self.extract_cache_key) if not_modified else None
+        if cached is not None:
+            counts["extract_cached"] += 1
+            business_name = cached["business_name"]
+            emails, phones, hrefs = set(cached["emails"]), set(cached["phones"]), cached["hrefs"]
+            anchors = cached["anchors"]
+            canonical = cached["canonical"]
+        else:
+            extracted = self._extract(html, url, counts)
+            business_name = extracted["business_name"]
+            emails, phones, hrefs = set(extracted["emails"]), set(extracted["phones"]), extracted["hrefs"]
+            anchors = extracted["anchors"]
+            canonical = extracted["canonical"]
+            if http_cache is not None:
+                http_cache.put_extract(url, self.extract_cache_key, extracted)
+        if canonical and _normalize_netloc(urlparse(canonical).netloc) != base_domain:
+            canonical = None
+
+        if not emails and detail and self.render_js and render_decision == "skip":
+            render_memory.count("skipped")
+            counts["render_skipped"] += 1
+            app.logger.debug("Not rendering %s: rendering never found more on %s", url, render_pattern)
+        elif not emails and detail and self.render_js and render_decision == "try":
             app.logger.debug("No emails via requests on probable detail %s — retrying with Playwright", url)
-            html_js, status_js = fetch_html(url, render_js=True)
-            app.logger.debug("Fetched %s status=%s len=%d (playwright)", url, status_js, len(html_js or ""))
+            html_js = self._render(url, counts)
+            app.logger.debug("Fetched %s len=%d (playwright)", url, len(html_js or ""))
             if html_js:
-                soup_js = BeautifulSoup(html_js, "html.parser")
+                extracted_js = self._extract(html_js, url, counts, include_attributes=False)
                 if not business_name:
-                    business_name = extract_business_name_from_soup(soup_js)
-                for e in EMAIL_REGEX.findall(html_js or ""):
-                    emails.add(e)
-                for a in soup_js.find_all("a", href=True):
-                    href = a["href"].strip()
-                    if href.lower().startswith("tel:"):
-                        num = href.split("tel:")[1].split("?")[0].strip()
-                        n = normalize_phone(num, region=phone_region)
-                        if n:
-                            phones.add(n)
-                    elif href.lower().startswith("mailto:"):
-                        addr = href.split("mailto:")[1].split("?")[0].strip()
-                        if EMAIL_REGEX.match(addr):
-                            emails.add(addr)
-                for tag_name in VISIBLE_TAGS:
-                    for tag in soup_js.find_all(tag_name):
-                        t = tag.get_text(" ", strip=True)
-                        if not t or len(t) > 300:
-                            continue
-                        for n in find_labelled_phones(t, region=phone_region):
-                            phones.add(n)
-
-        if emails or phones:
-            grp = url_map.setdefault(url, {"emails": set(), "phones": set(), "business_names": set()})
-            grp["emails"].update(emails)
-            grp["phones"].update(phones)
-            if business_name:
-                grp["business_names"].add(business_name)
-            for e in emails:
-                app.logger.info("Found email %s on %s", e, url)
-            for p in phones:
-                app.logger.info("Found phone %s on %s", p, url)
-
-        for a in soup.find_all("a", href=True):
-            href = a["href"].strip()
+                    business_name = extracted_js["business_name"]
+                known_phones = {normalize_phone(p, region=phone_region) for p in phones}
+                helped = bool(set(extracted_js["emails"]) - emails) or any(
+                    normalize_phone(p, region=phone_region) not in known_phones for p in extracted_js["phones"]
+                )
+                emails.update(extracted_js["emails"])
+                phones.update(extracted_js["phones"])
+                counts["render_helped"] += int(helped)
+                if render_pattern is not None:
+                    render_memory.record(base_domain, render_pattern, helped)
+
+        links: list[tuple[str, int, str]] = []
+        for href, anchor in zip(hrefs, anchors):
             if href.lower().startswith("mailto:") or href.lower().startswith("tel:"):
                 continue
 
@@ -7377,58 +10206,406 @@ def crawl(start_url: str, max_pages: int = 100, render_js: bool = False):
 
             if len(path_segments) == 1 and "_" in path_segments[0] and not path_segments[0].startswith("_assets"):
                 app.logger.debug("Prioritizing single-segment detail link: %s", link)
-                enqueue(link, left=True)
+                links.append((link, _CrawlFrontier.DETAIL, anchor))
                 continue
 
             if len(path_segments) >= 1 and path_segments[0] == "firmen" and len(path_segments) == 2:
-                if path_segments != start_segments:
+                if path_segments != self.start_segments:
                     app.logger.debug("Skipping region index link: %s", link)
                     continue
 
             if len(path_segments) > 2 and path_segments[0] == "firmen":
                 app.logger.debug("Prioritizing probable detail link: %s", link)
-                enqueue(link, left=True)
+                links.append((link, _CrawlFrontier.DETAIL, anchor))
                 continue
 
-            enqueue(link, left=False)
+            if _is_low_value_path(parsed_link.path):
+                links.append((link, _CrawlFrontier.LOW, anchor))
+                continue
 
-    rows = []
-    seen_emails = set()
-    seen_phones = set()
-    for url, grp in url_map.items():
-      emails = grp.get("emails", set())
-      phones = grp.get("phones", set())
-      business_names = grp.get("business_names", set())
-      business_name = next(iter(business_names), "")
-      if not business_name:
-        business_name = fallback_business_name_from_url(url)
+            links.append((link, _CrawlFrontier.NORMAL, anchor))
+
+        return {
+            "url": url,
+            "status": status_num,
+            "ok": True,
+            "bytes": page_bytes,
+            "emails": emails,
+            "phones": phones,
+            "business_name": business_name,
+            "canonical": canonical,
+            "links": links,
+            "fingerprint": fingerprint,
+            "stats": counts,
+        }
 
-      normalized_phones: list[str] = []
-      for phone in phones:
-        p = normalize_phone(phone, region=phone_region)
-        if not p or p in seen_phones:
-          continue
-        seen_phones.add(p)
-        normalized_phones.append(p)
+    def handle_page(self, page: dict[str, Any]) -> None:
+        """Apply a fetched page to the crawl; called in dispatch order."""
+        url = page["url"]
+        self.stats.update(page["stats"])
+        self.pages_fetched += 1
+        self.pages_since_contact += 1
+        self.bytes_read += page["bytes"]
+        if self.checkpoint is not None:
+            self.checkpoint.add_visited(_url_key(url))
+        if page["ok"] and page["fingerprint"] is not None:
+            original = self.near_duplicates.find(page["fingerprint"])
+            if original is None:
+                self.near_duplicates.add(url, page["fingerprint"])
+            else:
+                app.logger.debug("Skipping near-duplicate %s of %s", url, original)
+                page = {**page, "ok": False, "duplicate_of": original}
+        if not page["ok"]:
+            if page.get("duplicate_of"):
+                self.duplicates_skipped += 1
+            if self.scorer is not None:
+                self.scorer.record(url, False)
+            self.report(page)
+            return
 
-      new_emails: list[str] = []
-      for email in emails:
-        e = email.lower().strip()
-        if not e or e in seen_emails:
-          continue
-        seen_emails.add(e)
-        new_emails.append(email)
+        canonical = page["canonical"]
+        if canonical:
+            canonical_key = _url_key(canonical)
+            if canonical_key != _url_key(url):
+                if canonical_key in self.visited:
+                    # The page it names as canonical was already crawled.
+                    app.logger.debug("Skipping %s: canonical %s already crawled", url, canonical)
+                    self.canonical_duplicates += 1
+                    if self.scorer is not None:
+                        self.scorer.record(url, False)
+                    self.report(page)
+                    return
+                self.visited.add(canonical_key)
+                if self.checkpoint is not None:
+                    self.checkpoint.add_visited(canonical_key)
+
+        emails = page["emails"]
+        phones = page["phones"]
+        new_rows = 0
+        if emails or phones:
+            self.yielding_pages += 1
+            if url in self.seeded_urls:
+                self.yielding_seeded += 1
+            for e in emails:
+                app.logger.info("Found email %s on %s", e, url)
+            for p in phones:
+                app.logger.info("Found phone %s on %s", p, url)
+            for row in self.page_rows(url, emails, phones, page["business_name"]):
+                new_rows += 1
+                self._emit_row(row)
+
+        if new_rows:
+            self.pages_since_contact = 0
+        if self.scorer is not None:
+            self.scorer.record(url, new_rows > 0)
+        for link, tier, anchor in page["links"]:
+            self.enqueue(link, tier, anchor)
+
+        if self.save_seen:
+            self.checkpoint.add_seen("found_email", {e.lower() for e in emails} - self.found_emails)
+            self.checkpoint.add_seen("found_phone", phones - self.found_phones)
+        self.found_emails.update(e.lower() for e in emails)
+        self.found_phones.update(phones)
+        self.report(page)
+
+        self.pages_done += 1
+        if url in self.seeded_urls:
+            self.fetched_seeded += 1
+        if self.pages_done % 25 == 0:
+            app.logger.info("Crawl progress: %d pages, frontier %s", self.pages_done, self.frontier.stats())
+
+    def save_checkpoint(self) -> None:
+        self.last_checkpoint = self.pages_fetched
+        self.checkpoint_saves += 1
+        # Pages still in flight are not finished, so a resumed crawl queues them again (first, unless scored).
+        in_flight_entries = [(url, _CrawlFrontier.DETAIL, "") for url, _ in self.in_flight]
+        if self.large:
+            # The queue is saved with the checkpoint; this run skips these entries as visited.
+            self.frontier.restore_first(in_flight_entries)
+            entries = None
+        else:
+            entries = in_flight_entries + self.frontier.entries()
+        self.checkpoint.save(
+            entries,
+            {
+                "pages_fetched": self.pages_fetched,
+                "pages_done": self.pages_done,
+                "dispatched": self.dispatched - len(self.in_flight),
+                "canonical_duplicates": self.canonical_duplicates,
+                "duplicates_skipped": self.duplicates_skipped,
+                "yielding_pages": self.yielding_pages,
+                "fetched_seeded": self.fetched_seeded,
+                "yielding_seeded": self.yielding_seeded,
+                "pages_since_contact": self.pages_since_contact,
+                "bytes_read": self.bytes_read,
+            },
+            self.scorer.learned() if self.scorer is not None else None,
+        )
 
-      if new_emails:
-        phone_sample = normalized_phones[0] if normalized_phones else ""
-        for email in new_emails:
-          rows.append({"url": url, "business_name": business_name, "email": email, "phone": phone_sample})
-      else:
-        for phone in normalized_phones:
-          rows.append({"url": url, "business_name": business_name, "email": "", "phone": phone})
+    def report(self, page: dict[str, Any]) -> None:
+        if self.progress is None:
+            return
+        self.progress(
+            {
+                "url": page["url"],
+                "status": page["status"],
+                "pages_fetched": self.pages_fetched,
+                "contacts_found": len(self.found_emails) + len(self.found_phones),
+                "queue_size": len(self.frontier) + len(self.in_flight),
+                "duplicates_skipped": self.duplicates_skipped + self.canonical_duplicates,
+            }
+        )
+
+    def check_stop(self) -> str | None:
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            return "cancelled"
+        if self.deadline is not None and monotonic() >= self.deadline:
+            return "deadline"
+        if self.stall_pages and self.pages_since_contact >= self.stall_pages:
+            return "no_new_contacts"
+        if self.max_bytes and self.bytes_read >= self.max_bytes:
+            return "byte_budget"
+        return None
+
+    def _dispatch(self, executor: ThreadPoolExecutor) -> None:
+        window = self.limiter.concurrency
+        while (
+            self.stop_reason is None
+            and self.frontier
+            and len(self.in_flight) < window
+            and self.dispatched < self.max_pages
+        ):
+            url = self.frontier.pop()
+            url_key = _url_key(url)
+
+            if url_key in self.visited:
+                continue
+
+            parsed = urlparse(url)
+            if _normalize_netloc(parsed.netloc) != self.base_domain:
+                app.logger.debug("Skipping external host: %s", url)
+                continue
+
+            if self.budget is not None and not self.budget.take():
+                # The shared budget is spent; keep the page queued for the checkpoint.
+                self.frontier.restore([(url, _CrawlFrontier.DETAIL, "")])
+                self.stop_reason = "page_budget"
+                break
+
+            self.visited.add(url_key)
+            self.dispatched += 1
+            app.logger.info("Crawling: %s", url)
+            self.in_flight.append((url, executor.submit(self.fetch_page, url)))
+
+    def run(self) -> list[dict[str, str]]:
+        with ThreadPoolExecutor(max_workers=self.limiter.concurrency, thread_name_prefix="crawl") as executor:
+            while True:
+                if self.checkpoint is not None and self.pages_fetched - self.last_checkpoint >= CRAWLER_CHECKPOINT_PAGES:
+                    self.save_checkpoint()
+                if self.stop_reason is None:
+                    self.stop_reason = self.check_stop()
+                self._dispatch(executor)
+                if not self.in_flight:
+                    break
+                # Results are consumed in dispatch order so link expansion stays deterministic.
+                self.handle_page(self.in_flight.popleft()[1].result())
+
+        if self.checkpoint is not None:
+            self.save_checkpoint()
+        if self.stop_reason is None:
+            self.stop_reason = "max_pages" if self.dispatched >= self.max_pages else "frontier_empty"
+        if self.scorer is not None and self.yield_memory is not None:
+            learned = self.scorer.learned()
+            # A stopped crawl keeps its counts in the checkpoint until it is resumed and finishes.
+            resumable = (
+                self.scratch is None
+                and self.checkpoint is not None
+                and self.cancel_event is not None
+                and self.cancel_event.is_set()
+            )
+            if learned and not resumable:
+                self.yield_memory.record(self.base_domain, learned)
+        app.logger.info("Crawl summary for %s: %s", self.start_url, self.summary())
+        if self.on_stop is not None:
+            self.on_stop(self.stop_reason)
+        return self.rows
+
+    def summary(self) -> dict[str, Any]:
+        """This run's counters, as logged when it ends; ``process`` holds totals shared by all crawls."""
+        counts = self.stats
+
+        def section(*keys: str) -> dict[str, int]:
+            return {key: counts[key] for key in keys if counts[key]}
+
+        decoding = {}
+        for method in ("bom", "header", "meta", "utf8", "detected"):
+            decoded = counts[f"decoded_{method}"]
+            if decoded:
+                decoding[method] = {"pages": decoded, "avg_ms": round(counts[f"decode_us_{method}"] / 1000 / decoded, 2)}
+        politeness = self.politeness.stats()
+        summary: dict[str, Any] = {
+            "stop_reason": self.stop_reason,
+            "rows": self.row_count,
+            "pages": {
+                "dispatched": self.dispatched,
+                "fetched": self.pages_fetched,
+                "done": self.pages_done,
+                "with_contacts": self.yielding_pages,
+                "sitemap_seeded": self.fetched_seeded,
+                "sitemap_seeded_with_contacts": self.yielding_seeded,
+                "since_last_contact": self.pages_since_contact,
+            },
+            "duplicates": {"near": self.duplicates_skipped, "canonical": self.canonical_duplicates},
+            "frontier": self.frontier.stats(),
+            "fetch": section("bytes_read", "bytes_saved", "skipped_content_type", "skipped_too_large", "truncated"),
+            "decoding": decoding,
+            "politeness": {
+                **section("throttled", "waits", "wait_ms"),
+                "rate": politeness["rates"].get(self.base_domain, 0.0),
+            },
+            "extraction": section("extracted", "extract_cached"),
+            "phone_candidates": section(
+                "label_candidates", "token_candidates", "prefilter_rejected", "parser_rejected", "accepted"
+            ),
+            "process": {"phone_parse_cache": phone_parse_cache_stats()},
+        }
+        if self.scorer is not None:
+            best = sorted(self.scorer.learned().items(), key=lambda item: (-item[1][1], item[1][0]))[:5]
+            summary["contact_yield_patterns"] = {pattern: f"{hits}/{pages}" for pattern, (pages, hits) in best}
+        if self.http_cache is not None:
+            summary["http_cache"] = section("cache_conditional", "cache_hits", "cache_stored")
+        if self.render_js:
+            summary["rendering"] = section("renders", "render_ms", "render_helped", "render_skipped", "render_direct")
+            summary["process"]["playwright"] = _get_browser_pool().stats()
+        if self.extraction_pool is not None:
+            summary["process"]["extraction_pool"] = self.extraction_pool.stats()
+        if self.checkpoint is not None:
+            summary["checkpoint"] = {"saves": self.checkpoint_saves, "scratch": self.scratch is not None}
+        if self.large:
+            summary["large"] = {
+                "visited_keys": len(self.visited),
+                "bloom_false_positives": self.visited.false_positives,
+                "near_duplicate_window": LARGE_CRAWL_DUPLICATE_WINDOW,
+            }
+        return summary
+
+
+def _is_large_crawl(pages: int) -> bool:
+    """Whether a crawl of ``pages`` pages runs in large mode (see crawl())."""
+    return pages >= CRAWLER_LARGE_CRAWL_PAGES
+
+
+def crawl(
+    start_url: str,
+    max_pages: int = 100,
+    render_js: bool = False,
+    *,
+    concurrency: int | None = None,
+    per_host_limit: int | None = None,
+    limiter: _FetchLimiter | None = None,
+    politeness: _PolitenessScheduler | None = None,
+    use_sitemaps: bool | None = None,
+    progress: Callable[[dict[str, Any]], None] | None = None,
+    cancel_event: threading.Event | None = None,
+    on_row: Callable[[dict[str, str]], None] | None = None,
+    keep_rows: bool | None = None,
+    checkpoint: _CrawlCheckpoint | None = None,
+    budget: _CrawlBudget | None = None,
+    large: bool | None = None,
+    deadline: float | None = None,
+    stall_pages: int | None = None,
+    max_bytes: int | None = None,
+    on_stop: Callable[[str], None] | None = None,
+):
+    """
+    Crawl collecting emails and phones with stricter phone extraction rules.
 
-    app.logger.info("Crawl finished: found %d contact rows", len(rows))
-    return rows
+    Pages are fetched by a thread pool (``concurrency`` workers, at most
+    ``per_host_limit`` per host) but processed in frontier order, so detail
+    links in the frontier's detail tier are still crawled first. Request pacing
+    per host comes from ``politeness`` (the shared scheduler by default); pages
+    answered with 429/503 are retried after the backoff instead of being skipped.
+    Near-duplicate pages are also decided in that order, so which pages are
+    skipped does not depend on which fetch finishes first. When the crawl ends
+    its counters and component stats are logged once, as one summary.
+
+    With ``use_sitemaps`` (default ``CRAWLER_SITEMAPS``) the site's sitemaps are
+    read first and the detail pages they list are queued directly, so the
+    budget is not spent walking index pages to find them. When the crawl
+    starts below the site root, only detail pages under the start path are seeded.
+
+    Several crawls can share one ``limiter`` (a global fetch concurrency) and one
+    ``budget`` (a global page count); each still stops at its own ``max_pages``.
+
+    ``progress`` is called after every processed page with running counters.
+    Setting ``cancel_event`` stops dispatching new pages; pages already in flight
+    are finished and the contacts found so far are returned.
+
+    Contact rows are final as soon as their page is processed, so ``on_row``
+    receives each one immediately. With ``keep_rows=False`` rows are only
+    streamed through ``on_row`` and not also collected for the return value;
+    that is the default for a ``large`` crawl, other crawls keep them.
+
+    With a ``checkpoint`` the frontier, visited set and contacts are saved every
+    ``CRAWLER_CHECKPOINT_PAGES`` pages and when the crawl stops. If the checkpoint
+    already holds a saved state, the crawl continues from it instead of starting
+    over: finished pages are not fetched again, and their rows are passed to
+    ``on_row`` again (and returned) before any new ones.
+
+    Besides ``max_pages`` the crawl stops dispatching new pages at ``deadline``
+    (a ``monotonic()`` time), after ``stall_pages`` pages in a row without a new
+    contact, or once ``max_bytes`` of page bodies were downloaded (Playwright
+    renders not included). They default to ``CRAWLER_TIME_LIMIT_MINUTES``,
+    ``CRAWLER_STALL_PAGES`` and ``CRAWLER_MAX_CRAWL_MB`` (0 turns a condition off). Pages in flight are finished and the contacts found
+    so far returned. ``on_stop`` receives why the crawl ended: ``frontier_empty``,
+    ``max_pages``, ``page_budget``, ``cancelled`` or one of ``CRAWL_EARLY_STOP_REASONS``.
+
+    A ``large`` crawl (by default one of at least ``CRAWLER_LARGE_CRAWL_PAGES``
+    pages) keeps its frontier, visited keys and seen contacts in the checkpoint
+    database, or in a scratch database removed at the end when there is no
+    checkpoint, and remembers only recent pages for near-duplicate checks, so its
+    memory use does not grow with the crawl. Its rows are not returned unless
+    ``keep_rows=True`` is passed explicitly.
+
+    With ``CRAWLER_CONTACT_PRIORITY`` the frontier favours Impressum and contact
+    links and URL patterns that produced new contacts on this domain, in this
+    crawl and in earlier ones, so ``max_pages`` goes further.
+    """
+    if large is None:
+        large = _is_large_crawl(max_pages)
+    if keep_rows is None:
+        keep_rows = not large
+    scratch = None
+    if large and checkpoint is None:
+        scratch_path = os.path.join(CRAWLER_DATA_DIR, "scratch", f"crawl-{secrets.token_hex(8)}.sqlite3")
+        checkpoint = scratch = _CrawlCheckpoint(scratch_path)
+    try:
+        return _SiteCrawl(
+            start_url,
+            max_pages,
+            render_js,
+            concurrency=concurrency,
+            per_host_limit=per_host_limit,
+            limiter=limiter,
+            politeness=politeness,
+            use_sitemaps=use_sitemaps,
+            progress=progress,
+            cancel_event=cancel_event,
+            on_row=on_row,
+            keep_rows=keep_rows,
+            checkpoint=checkpoint,
+            budget=budget,
+            large=large,
+            deadline=deadline,
+            stall_pages=stall_pages,
+            max_bytes=max_bytes,
+            on_stop=on_stop,
+            scratch=scratch,
+        ).run()
+    finally:
+        # Also when the crawl raises; a checkpoint passed in is kept for resuming.
+        if scratch is not None:
+            scratch.remove()
 
 
 def _sanitize_text_value(value: Any, *, strip_punctuation: bool = True) -> str:
@@ -7497,44 +10674,66 @@ def clean_contacts_with_pandas(rows: list[dict[str, str]]) -> list[dict[str, str
   return df[["contact_id", "business_name", "email", "phone"]].to_dict(orient="records")
 
 
-def clean_contacts_without_pandas(rows: list[dict[str, str]]) -> list[dict[str, str]]:
-  cleaned: list[dict[str, str]] = []
-  seen_rows: set[tuple[str, str, str]] = set()
-  seen_emails: set[str] = set()
-  seen_phones: set[str] = set()
+class _ContactCleaner:
+  """Row-at-a-time contact cleaning: sanitize, then drop empty and duplicate contacts.
 
-  for row in rows or []:
+  Keeps the same rows as ``clean_contacts()``. With ``match_pandas`` (the default
+  when pandas is installed) it follows ``clean_contacts_with_pandas``: an email
+  or phone seen on any earlier non-duplicate row counts as a duplicate, even when
+  that row was itself dropped for its other channel. Without it only the
+  channels of kept rows count, like ``clean_contacts_without_pandas``.
+
+  With a ``store`` connection the seen rows, emails and phones are kept in that
+  database rather than in memory, for large crawls.
+  """
+
+  def __init__(self, store: sqlite3.Connection | None = None, match_pandas: bool | None = None):
+    self.count = 0
+    self.match_pandas = (PANDAS_AVAILABLE and pd is not None) if match_pandas is None else match_pandas
+    self._seen_rows: set[str] | _DiskSet = _DiskSet(store, "row") if store is not None else set()
+    self._seen_emails: set[str] | _DiskSet = _DiskSet(store, "email") if store is not None else set()
+    self._seen_phones: set[str] | _DiskSet = _DiskSet(store, "phone") if store is not None else set()
+
+  def add(self, row: dict[str, str] | None) -> dict[str, Any] | None:
     business_name = _sanitize_text_value((row or {}).get("business_name"))
     email = _sanitize_text_value((row or {}).get("email"), strip_punctuation=False)
     phone = _normalize_report_phone(_sanitize_text_value((row or {}).get("phone"), strip_punctuation=False))
 
     if not email and not phone:
-      continue
+      return None
 
-    row_key = (business_name, email, phone)
-    if row_key in seen_rows:
-      continue
+    row_key = "\x1f".join((business_name, email, phone))
+    if row_key in self._seen_rows:
+      return None
 
-    if email and email in seen_emails:
-      continue
-    if phone and phone in seen_phones:
-      continue
+    duplicate = bool(email and email in self._seen_emails) or bool(phone and phone in self._seen_phones)
+    if duplicate and not self.match_pandas:
+      return None
 
-    seen_rows.add(row_key)
+    self._seen_rows.add(row_key)
     if email:
-      seen_emails.add(email)
+      self._seen_emails.add(email)
     if phone:
-      seen_phones.add(phone)
+      self._seen_phones.add(phone)
+    if duplicate:
+      return None
+
+    self.count += 1
+    return {
+      "contact_id": self.count,
+      "business_name": business_name,
+      "email": email,
+      "phone": phone,
+    }
 
-    cleaned.append(
-      {
-        "contact_id": len(cleaned) + 1,
-        "business_name": business_name,
-        "email": email,
-        "phone": phone,
-      }
-    )
 
+def clean_contacts_without_pandas(rows: list[dict[str, str]]) -> list[dict[str, str]]:
+  cleaner = _ContactCleaner(match_pandas=False)
+  cleaned: list[dict[str, str]] = []
+  for row in rows or []:
+    contact = cleaner.add(row)
+    if contact is not None:
+      cleaned.append(contact)
   return cleaned
 
 
@@ -8311,6 +11510,422 @@ def _generate_contacts_pdf(rows: list[dict[str, str]]):
     return buf
 
 
+# --- Background crawl jobs ---
+
+CRAWLER_JOB_WORKERS = _env_int("CRAWLER_JOB_WORKERS", 2, minimum=1)
+CRAWLER_JOB_RETENTION_DAYS = _env_int("CRAWLER_JOB_RETENTION_DAYS", 7, minimum=1)
+CRAWLER_JOB_PROGRESS_INTERVAL = 1.0  # seconds between progress writes to the database
+CRAWLER_BATCH_MAX_SEEDS = _env_int("CRAWLER_BATCH_MAX_SEEDS", 100, minimum=1)
+CRAWLER_BATCH_MAX_PAGES = _env_int("CRAWLER_BATCH_MAX_PAGES", 2000, minimum=1)
+CRAWLER_BATCH_SITES = _env_int("CRAWLER_BATCH_SITES", 4, minimum=1)  # sites crawled at once within a batch job
+CRAWL_JOB_ACTIVE_STATUSES = ("queued", "running")
+CRAWL_JOB_EVENTS_PAGE = 500  # events returned per poll of a job's event log
+CRAWL_JOB_CONTACT_FIELDS = ("contact_id", "business_name", "email", "phone", "url")
+
+_crawl_job_executor: ThreadPoolExecutor | None = None
+_crawl_job_executor_lock = threading.Lock()
+# Cancel flags for jobs owned by this process; other workers see cancellation through the database.
+_crawl_job_cancel_events: dict[str, threading.Event] = {}
+
+
+def _get_crawl_job_executor() -> ThreadPoolExecutor:
+    global _crawl_job_executor
+    with _crawl_job_executor_lock:
+        if _crawl_job_executor is None:
+            _crawl_job_executor = ThreadPoolExecutor(
+                max_workers=CRAWLER_JOB_WORKERS, thread_name_prefix="crawl-job"
+            )
+        return _crawl_job_executor
+
+
+def _crawl_job_path(job_id: str, suffix: str) -> str:
+    """Per-job files: ``.pdf`` report (``.contacts.csv`` for large crawls), ``.events.jsonl`` progress log,
+    ``.contacts.jsonl`` rows, ``.cleaner.sqlite3`` duplicate keys of a large crawl, ``.checkpoint.sqlite3``
+    resume state (``.checkpoint-<n>.sqlite3`` for further batch seeds)."""
+    return os.path.join(CRAWLER_DATA_DIR, f"{job_id}{suffix}")
+
+
+def _crawl_job_is_large(job: CrawlJob) -> bool:
+    """Large jobs keep their duplicate checks on disk and produce a CSV instead of a PDF report."""
+    return _is_large_crawl(job.page_budget or job.max_pages)
+
+
+def _crawl_job_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _crawl_job_is_orphaned(job: CrawlJob) -> bool:
+    """True when an active job's owning process on this host is gone (restart, deploy, crash)."""
+    host, _, pid_text = (job.owner or "").rpartition(":")
+    if host != socket.gethostname():
+        return False
+    try:
+        pid = int(pid_text)
+    except ValueError:
+        return True
+    if pid == os.getpid():
+        return job.id not in _crawl_job_cancel_events
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
+def _load_crawl_job(db, job_id: str) -> CrawlJob | None:
+    job = db.get(CrawlJob, job_id)
+    if job is not None and job.status in CRAWL_JOB_ACTIVE_STATUSES and _crawl_job_is_orphaned(job):
+        job.status = "failed"
+        job.error = "The crawl was interrupted by a server restart."
+        if _crawl_job_has_checkpoint(job):
+            job.error += " It can be resumed from its last checkpoint."
+        job.finished_at = datetime.utcnow()
+        db.commit()
+    return job
+
+
+def _crawl_job_seeds(job: CrawlJob) -> list[str]:
+    return json.loads(job.seeds) if job.seeds else [job.start_url]
+
+
+def _crawl_job_checkpoint(job_id: str, index: int = 0) -> _CrawlCheckpoint:
+    suffix = ".checkpoint.sqlite3" if index == 0 else f".checkpoint-{index}.sqlite3"
+    return _CrawlCheckpoint(_crawl_job_path(job_id, suffix))
+
+
+def _crawl_job_has_checkpoint(job: CrawlJob) -> bool:
+    return any(_crawl_job_checkpoint(job.id, index).exists() for index in range(len(_crawl_job_seeds(job))))
+
+
+def _crawl_job_can_resume(job: CrawlJob) -> bool:
+    return job.status in ("cancelled", "failed") and _crawl_job_has_checkpoint(job)
+
+
+def _serialize_crawl_job(job: CrawlJob) -> dict[str, Any]:
+    has_result = bool(job.result_path) and job.status in ("finished", "cancelled")
+    return {
+        "id": job.id,
+        "status": job.status,
+        "start_url": job.start_url,
+        "max_pages": job.max_pages,
+        "seed_count": len(_crawl_job_seeds(job)),
+        "page_budget": job.page_budget,
+        "pages_fetched": job.pages_fetched,
+        "contacts_found": job.contacts_found,
+        "queue_size": job.queue_size,
+        "row_count": job.row_count,
+        "cancel_requested": bool(job.cancel_requested),
+        "stop_reason": job.stop_reason,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "download_url": url_for("crawler_job_download", job_id=job.id) if has_result else None,
+        "events_url": url_for("crawler_job_events", job_id=job.id),
+        "csv_url": url_for("crawler_job_contacts", job_id=job.id, fmt="csv"),
+        "jsonl_url": url_for("crawler_job_contacts", job_id=job.id, fmt="jsonl"),
+        "resume_url": url_for("crawler_job_resume", job_id=job.id) if _crawl_job_can_resume(job) else None,
+    }
+
+
+def _purge_old_crawl_jobs(db) -> None:
+    cutoff = datetime.utcnow() - timedelta(days=CRAWLER_JOB_RETENTION_DAYS)
+    stale = (
+        db.query(CrawlJob)
+        .filter(CrawlJob.created_at < cutoff, CrawlJob.status.notin_(CRAWL_JOB_ACTIVE_STATUSES))
+        .all()
+    )
+    for job in stale:
+        for index in range(len(_crawl_job_seeds(job))):
+            _crawl_job_checkpoint(job.id, index).remove()
+        for suffix in (".pdf", ".contacts.csv", ".events.jsonl", ".contacts.jsonl", ".cleaner.sqlite3"):
+            path = _crawl_job_path(job.id, suffix)
+            if not os.path.exists(path):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                app.logger.warning("Could not remove crawl result %s", path)
+        db.delete(job)
+    if stale:
+        db.commit()
+    # Scratch databases of large crawls that ended with an error; live ones are written at every checkpoint.
+    scratch_dir = os.path.join(CRAWLER_DATA_DIR, "scratch")
+    for name in os.listdir(scratch_dir) if os.path.isdir(scratch_dir) else ():
+        path = os.path.join(scratch_dir, name)
+        try:
+            if datetime.utcfromtimestamp(os.path.getmtime(path)) < cutoff:
+                os.remove(path)
+        except OSError:
+            app.logger.warning("Could not remove crawl scratch file %s", path)
+
+
+def _run_crawl_job(job_id: str) -> None:
+    """Run a queued job: crawl each seed (several at once for a batch) and write one cleaned contact list and PDF.
+
+    A large job (see ``_crawl_job_is_large``) checks duplicates against a scratch
+    SQLite file and writes its result as CSV, so memory use does not grow with it.
+    """
+    cancel_event = _crawl_job_cancel_events.setdefault(job_id, threading.Event())
+    checkpoints: list[_CrawlCheckpoint] = []
+    cleaner_store: sqlite3.Connection | None = None
+    cleaner_path = _crawl_job_path(job_id, ".cleaner.sqlite3")
+    db = SessionLocal()
+    try:
+        job = db.get(CrawlJob, job_id)
+        if job is None or job.status != "queued":
+            return
+        if job.cancel_requested:
+            job.status = "cancelled"
+            job.finished_at = datetime.utcnow()
+            db.commit()
+            return
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        db.commit()
+
+        os.makedirs(CRAWLER_DATA_DIR, exist_ok=True)
+        seeds = _crawl_job_seeds(job)
+        checkpoints = [_crawl_job_checkpoint(job_id, index) for index in range(len(seeds))]
+        # Sites of a batch share the fetch concurrency and the page budget.
+        limiter = _FetchLimiter(CRAWLER_CONCURRENCY, CRAWLER_PER_HOST_CONCURRENCY)
+        budget = _CrawlBudget(job.page_budget) if job.page_budget else None
+        deadline = monotonic() + CRAWLER_TIME_LIMIT_MINUTES * 60 if CRAWLER_TIME_LIMIT_MINUTES else None
+        contacts_path = _crawl_job_path(job_id, ".contacts.jsonl")
+        large = _crawl_job_is_large(job)
+        if large:
+            # Rebuilt from the rows passed to on_row, like the contacts file; nothing here needs to survive a crash.
+            if os.path.exists(cleaner_path):
+                os.remove(cleaner_path)
+            cleaner_store = sqlite3.connect(cleaner_path, isolation_level=None, check_same_thread=False)
+            cleaner_store.execute("PRAGMA journal_mode=OFF")
+            cleaner_store.execute("PRAGMA synchronous=OFF")
+        cleaner = _ContactCleaner(cleaner_store)
+        site_progress: dict[int, dict[str, Any]] = {}
+        stop_reasons: dict[int, str] = {}
+        lock = threading.Lock()
+
+        def totals() -> dict[str, int]:
+            return {
+                key: sum(update[key] for update in site_progress.values())
+                for key in ("pages_fetched", "contacts_found", "queue_size")
+            }
+
+        # A resumed crawl passes its checkpointed rows to on_row again, so the contacts file starts over.
+        with open(_crawl_job_path(job_id, ".events.jsonl"), "a", encoding="utf-8") as events_file, open(
+            contacts_path, "w", encoding="utf-8"
+        ) as contacts_file:
+
+            def emit(event: dict[str, Any]) -> None:
+                events_file.write(json.dumps(event, ensure_ascii=False) + "\n")
+                events_file.flush()
+
+            def on_progress(index: int, update: dict[str, Any]) -> None:
+                with lock:
+                    site_progress[index] = update
+                    emit({"type": "page", **update, **totals(), "rows": cleaner.count})
+
+            def on_row(row: dict[str, str]) -> None:
+                with lock:
+                    contact = cleaner.add(row)
+                    if contact is None:
+                        return
+                    contact["url"] = row.get("url", "")
+                    contacts_file.write(json.dumps(contact, ensure_ascii=False) + "\n")
+                    contacts_file.flush()
+                    emit({"type": "contact", **contact})
+
+            def on_stop(index: int, reason: str) -> None:
+                with lock:
+                    stop_reasons[index] = reason
+                    emit({"type": "stop", "url": seeds[index], "reason": reason})
+
+            def crawl_site(index: int) -> None:
+                crawl(
+                    seeds[index],
+                    max_pages=job.max_pages,
+                    render_js=job.render_js,
+                    limiter=limiter,
+                    budget=budget,
+                    progress=lambda update: on_progress(index, update),
+                    cancel_event=cancel_event,
+                    on_row=on_row,
+                    keep_rows=False,
+                    checkpoint=checkpoints[index],
+                    large=large,
+                    deadline=deadline,
+                    on_stop=lambda reason: on_stop(index, reason),
+                )
+
+            with ThreadPoolExecutor(
+                max_workers=min(len(seeds), CRAWLER_BATCH_SITES), thread_name_prefix="crawl-site"
+            ) as sites:
+                pending = {sites.submit(crawl_site, index) for index in range(len(seeds))}
+                while pending:
+                    done, pending = wait(pending, timeout=CRAWLER_JOB_PROGRESS_INTERVAL, return_when=FIRST_EXCEPTION)
+                    failed = next((future for future in done if future.exception() is not None), None)
+                    if failed is not None:
+                        # Stop the other sites; their checkpoints keep the job resumable.
+                        cancel_event.set()
+                        raise failed.exception()
+                    with lock:
+                        if site_progress:
+                            counts = totals()
+                            job.pages_fetched = counts["pages_fetched"]
+                            job.contacts_found = counts["contacts_found"]
+                            job.queue_size = counts["queue_size"]
+                        job.row_count = cleaner.count
+                    db.commit()
+                    # The commit expired the row, so this reads a cancel issued by any worker.
+                    if job.cancel_requested:
+                        cancel_event.set()
+
+        if large:
+            # A PDF of tens of thousands of rows is built in memory and of little use; stream a CSV instead.
+            result_path = _crawl_job_path(job_id, ".contacts.csv")
+            with open(contacts_path, encoding="utf-8") as fh, open(
+                result_path, "w", encoding="utf-8", newline=""
+            ) as out:
+                writer = csv.DictWriter(out, fieldnames=CRAWL_JOB_CONTACT_FIELDS, extrasaction="ignore")
+                writer.writeheader()
+                for line in fh:
+                    if line.strip():
+                        writer.writerow(json.loads(line))
+        else:
+            with open(contacts_path, encoding="utf-8") as fh:
+                cleaned_data = [json.loads(line) for line in fh if line.strip()]
+            pdf_buffer = _generate_contacts_pdf(cleaned_data)
+            result_path = _crawl_job_path(job_id, ".pdf")
+            with open(result_path, "wb") as fh:
+                fh.write(pdf_buffer.getvalue())
+
+        job.queue_size = 0
+        job.row_count = cleaner.count
+        job.result_path = result_path
+        job.stop_reason = ", ".join(dict.fromkeys(stop_reasons[index] for index in sorted(stop_reasons))) or None
+        job.status = "cancelled" if cancel_event.is_set() else "finished"
+        job.finished_at = datetime.utcnow()
+        db.commit()
+        if job.status == "finished":
+            for checkpoint in checkpoints:
+                checkpoint.remove()
+    except Exception as exc:
+        app.logger.exception("Crawl job %s failed", job_id)
+        db.rollback()
+        job = db.get(CrawlJob, job_id)
+        if job is not None:
+            job.status = "failed"
+            job.error = str(exc) or exc.__class__.__name__
+            job.finished_at = datetime.utcnow()
+            db.commit()
+    finally:
+        for checkpoint in checkpoints:
+            checkpoint.close()
+        if cleaner_store is not None:
+            cleaner_store.close()
+            try:
+                os.remove(cleaner_path)
+            except OSError:
+                pass
+        _crawl_job_cancel_events.pop(job_id, None)
+        SessionLocal.remove()
+
+
+def _read_crawl_job_lines(path: str, offset: int = 0, limit: int | None = None) -> tuple[list[str], int]:
+    """Complete lines of a job's append-only file after byte ``offset``, and the offset after them.
+
+    A partly written last line is left for the next read.
+    """
+    lines: list[str] = []
+    if not os.path.exists(path):
+        return lines, offset
+    with open(path, "rb") as fh:
+        fh.seek(offset)
+        while limit is None or len(lines) < limit:
+            raw = fh.readline()
+            if not raw.endswith(b"\n"):
+                break
+            offset += len(raw)
+            lines.append(raw.decode("utf-8").rstrip("\n"))
+    return lines, offset
+
+
+_SEED_SEPARATOR_REGEX = re.compile(r"[\s,;]+")
+
+
+def _parse_crawl_seeds(*sources: str) -> list[str]:
+    """Start URLs from pasted text or CSV content, one per line or cell, keeping the first per domain.
+
+    Cells without a dot (headers, names) and email addresses are ignored; bare domains get https://.
+    """
+    seeds: list[str] = []
+    domains: set[str] = set()
+    for source in sources:
+        for token in _SEED_SEPARATOR_REGEX.split(source or ""):
+            value = token.strip("\"'<>")
+            if "." not in value or "@" in value.split("/")[0]:
+                continue
+            if "://" not in value:
+                value = "https://" + value
+            parsed = urlparse(value)
+            if parsed.scheme not in ("http", "https") or not parsed.hostname:
+                continue
+            domain = _normalize_netloc(parsed.netloc)
+            if domain in domains:
+                continue
+            domains.add(domain)
+            seeds.append(value)
+    return seeds
+
+
+def submit_crawl_job(
+    db,
+    start_url: str,
+    max_pages: int,
+    render_js: bool,
+    seeds: list[str] | None = None,
+    page_budget: int | None = None,
+) -> CrawlJob:
+    """Record a crawl job and hand it to the background executor.
+
+    With ``seeds`` it is a batch job: every seed is crawled up to ``max_pages``
+    while all of them together stop at ``page_budget``.
+    """
+    _purge_old_crawl_jobs(db)
+    job = CrawlJob(
+        id=secrets.token_hex(16),
+        start_url=seeds[0] if seeds else start_url,
+        max_pages=max_pages,
+        render_js=render_js,
+        seeds=json.dumps(seeds) if seeds else None,
+        page_budget=page_budget,
+        status="queued",
+        owner=_crawl_job_owner(),
+    )
+    db.add(job)
+    db.commit()
+    _crawl_job_cancel_events[job.id] = threading.Event()
+    _get_crawl_job_executor().submit(_run_crawl_job, job.id)
+    return job
+
+
+def resume_crawl_job(db, job: CrawlJob) -> CrawlJob:
+    """Queue a cancelled or interrupted job again; it continues from its last checkpoint."""
+    job.status = "queued"
+    job.cancel_requested = False
+    job.owner = _crawl_job_owner()
+    job.error = None
+    job.stop_reason = None
+    job.result_path = None
+    job.finished_at = None
+    db.commit()
+    _crawl_job_cancel_events[job.id] = threading.Event()
+    _get_crawl_job_executor().submit(_run_crawl_job, job.id)
+    return job
+
+
 def _site_exists(db, name: str, address: str, exclude_id: int | None = None) -> bool:
     """Return True if a site with same name+address (case-insensitive) exists."""
     name_norm = (name or "").strip().lower()
@@ -10355,36 +13970,212 @@ def index():
             HTML_TEMPLATE,
             gpt_enabled=bool(openai_client),
             active_page="crawler",
+            batch_max_pages=CRAWLER_BATCH_MAX_PAGES,
+            max_pages_limit=CRAWLER_MAX_PAGES,
+            large_crawl_pages=CRAWLER_LARGE_CRAWL_PAGES,
         )
 
-    if not REPORTLAB_AVAILABLE:
-        return (
-            jsonify({"error": "reportlab not installed; cannot generate PDF output."}),
-            503,
-        )
     start_url = (request.form.get("start_url") or "").strip()
-    if not start_url:
+    seeds_text = request.form.get("seeds") or ""
+    seeds_file = request.files.get("seeds_file")
+    if seeds_file and seeds_file.filename:
+        seeds_text += "\n" + seeds_file.read().decode("utf-8-sig", errors="replace")
+
+    seeds = None
+    if seeds_text.strip():
+        seeds = _parse_crawl_seeds(start_url, seeds_text)
+        if len(seeds) > CRAWLER_BATCH_MAX_SEEDS:
+            return jsonify({"error": f"Too many websites; a batch crawl takes at most {CRAWLER_BATCH_MAX_SEEDS}."}), 400
+        if len(seeds) == 1:
+            start_url, seeds = seeds[0], None
+    if not start_url and not seeds:
         return jsonify({"error": "Missing start URL"}), 400
 
     try:
         max_pages = int(request.form.get("max_pages", "100"))
     except (TypeError, ValueError):
         max_pages = 100
-    max_pages = max(1, min(max_pages, 200))
+    max_pages = max(1, min(max_pages, CRAWLER_MAX_PAGES))
+
+    page_budget = None
+    if seeds:
+        try:
+            page_budget = int(request.form.get("page_budget") or max_pages * len(seeds))
+        except (TypeError, ValueError):
+            page_budget = max_pages * len(seeds)
+        page_budget = max(1, min(page_budget, CRAWLER_BATCH_MAX_PAGES))
+
+    # Large jobs write CSV (see _crawl_job_is_large); only the others need reportlab for their PDF.
+    if not REPORTLAB_AVAILABLE and not _is_large_crawl(page_budget or max_pages):
+        return (
+            jsonify({"error": "reportlab not installed; cannot generate PDF output."}),
+            503,
+        )
 
     render_js = bool(request.form.get("render_js"))
 
-    data = crawl(start_url, max_pages=max_pages, render_js=render_js)
-    cleaned_data = clean_contacts(data)
+    db = SessionLocal()
+    try:
+        job = submit_crawl_job(db, start_url, max_pages, render_js, seeds=seeds, page_budget=page_budget)
+        return jsonify(_serialize_crawl_job(job)), 202
+    finally:
+        db.close()
 
-    pdf_buffer = _generate_contacts_pdf(cleaned_data)
-    filename = f"putzelf_contacts_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.pdf"
 
-    return send_file(
-        pdf_buffer,
-        mimetype="application/pdf",
-        as_attachment=True,
-        download_name=filename,
+@app.route("/crawler/jobs/<job_id>", methods=["GET"])
+@login_required
+def crawler_job_status(job_id: str):
+    db = SessionLocal()
+    try:
+        job = _load_crawl_job(db, job_id)
+        if job is None:
+            return jsonify({"error": "Crawl job not found"}), 404
+        return jsonify(_serialize_crawl_job(job))
+    finally:
+        db.close()
+
+
+@app.route("/crawler/jobs/<job_id>/cancel", methods=["POST"])
+@login_required
+def crawler_job_cancel(job_id: str):
+    db = SessionLocal()
+    try:
+        job = _load_crawl_job(db, job_id)
+        if job is None:
+            return jsonify({"error": "Crawl job not found"}), 404
+        if job.status in CRAWL_JOB_ACTIVE_STATUSES:
+            job.cancel_requested = True
+            db.commit()
+            event = _crawl_job_cancel_events.get(job.id)
+            if event is not None:
+                event.set()
+        return jsonify(_serialize_crawl_job(job))
+    finally:
+        db.close()
+
+
+@app.route("/crawler/jobs/<job_id>/resume", methods=["POST"])
+@login_required
+def crawler_job_resume(job_id: str):
+    db = SessionLocal()
+    try:
+        job = _load_crawl_job(db, job_id)
+        if job is None:
+            return jsonify({"error": "Crawl job not found"}), 404
+        if not _crawl_job_can_resume(job):
+            return jsonify({"error": "Crawl job has no checkpoint to resume from"}), 409
+        job = resume_crawl_job(db, job)
+        return jsonify(_serialize_crawl_job(job)), 202
+    finally:
+        db.close()
+
+
+@app.route("/crawler/jobs/<job_id>/download", methods=["GET"])
+@login_required
+def crawler_job_download(job_id: str):
+    db = SessionLocal()
+    try:
+        job = _load_crawl_job(db, job_id)
+        if job is None:
+            return jsonify({"error": "Crawl job not found"}), 404
+        if job.status not in ("finished", "cancelled") or not job.result_path or not os.path.exists(job.result_path):
+            return jsonify({"error": "Crawl result is not available"}), 409
+        stamp = (job.finished_at or datetime.utcnow()).strftime("%Y%m%d_%H%M%S")
+        # Large crawls produce a CSV rather than a PDF report.
+        is_csv = job.result_path.endswith(".csv")
+        return send_file(
+            job.result_path,
+            mimetype="text/csv" if is_csv else "application/pdf",
+            as_attachment=True,
+            download_name=f"putzelf_contacts_{stamp}.{'csv' if is_csv else 'pdf'}",
+        )
+    finally:
+        db.close()
+
+
+@app.route("/crawler/jobs/<job_id>/events", methods=["GET"])
+@login_required
+def crawler_job_events(job_id: str):
+    """``page``, ``contact`` and ``stop`` events logged after the ``after`` cursor, plus the job status.
+
+    The cursor is a byte offset into the job's event log; pass the returned
+    ``next`` to get the following events; ``more`` means there are more
+    already. The request returns at once, so polling a running job never
+    holds a worker.
+    """
+    try:
+        after = max(0, int(request.args.get("after") or 0))
+    except ValueError:
+        after = 0
+    db = SessionLocal()
+    try:
+        # Read the status first so events written just before the job ended are not missed.
+        job = _load_crawl_job(db, job_id)
+        if job is None:
+            return jsonify({"error": "Crawl job not found"}), 404
+        payload = _serialize_crawl_job(job)
+    finally:
+        db.close()
+    lines, next_offset = _read_crawl_job_lines(_crawl_job_path(job_id, ".events.jsonl"), after, CRAWL_JOB_EVENTS_PAGE)
+    return jsonify(
+        {
+            "events": [json.loads(line) for line in lines],
+            "next": next_offset,
+            "more": len(lines) == CRAWL_JOB_EVENTS_PAGE,
+            "job": payload,
+        }
+    )
+
+
+@app.route("/crawler/jobs/<job_id>/contacts.<fmt>", methods=["GET"])
+@login_required
+def crawler_job_contacts(job_id: str, fmt: str):
+    """The job's contact rows found so far, as CSV or JSONL."""
+    if fmt not in ("csv", "jsonl"):
+        return jsonify({"error": "Unsupported format"}), 404
+    db = SessionLocal()
+    try:
+        job = _load_crawl_job(db, job_id)
+        if job is None:
+            return jsonify({"error": "Crawl job not found"}), 404
+        stamp = (job.created_at or datetime.utcnow()).strftime("%Y%m%d_%H%M%S")
+    finally:
+        db.close()
+    path = _crawl_job_path(job_id, ".contacts.jsonl")
+
+    # Stop near the size at request time, so a busy crawl cannot keep the download open.
+    end = os.path.getsize(path) if os.path.exists(path) else 0
+
+    def generate():
+        if fmt == "csv":
+            buf = io.StringIO()
+            writer = csv.DictWriter(buf, fieldnames=CRAWL_JOB_CONTACT_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+        offset = 0
+        while offset < end:
+            lines, offset = _read_crawl_job_lines(path, offset, CRAWL_JOB_EVENTS_PAGE)
+            if not lines:
+                break
+            if fmt == "jsonl":
+                yield "".join(line + "\n" for line in lines)
+                continue
+            for line in lines:
+                writer.writerow(json.loads(line))
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+        if fmt == "csv" and buf.tell():
+            yield buf.getvalue()
+
+    mimetype = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return Response(
+        generate(),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=putzelf_contacts_{stamp}.{fmt}",
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
     )
 
 